@@ -8,6 +8,11 @@ This example demonstrates advanced patterns with ProviderModule:
 - Complex initialization sequences
 """
 
+import contextlib
+import io
+import sys
+from types import MappingProxyType
+
 from injectq import InjectQ
 from injectq.modules import ProviderModule, provider
 
@@ -18,6 +23,8 @@ from injectq.modules import ProviderModule, provider
 class DatabaseConfig:
     """Database configuration."""
 
+    __slots__ = ("database", "host", "port", "ssl_enabled")
+
     def __init__(self, host: str, port: int, database: str, ssl_enabled: bool) -> None:
         self.host = host
         self.port = port
@@ -31,6 +38,8 @@ class DatabaseConfig:
 class Database:
     """Database connection."""
 
+    __slots__ = ("config", "connected")
+
     def __init__(self, config: DatabaseConfig) -> None:
         self.config = config
         self.connected = False
@@ -49,6 +58,8 @@ class Database:
 class Logger:
     """Application logger."""
 
+    __slots__ = ("format", "level")
+
     def __init__(self, level: str, format_string: str) -> None:
         self.level = level
         self.format = format_string
@@ -61,6 +72,8 @@ class Logger:
 class Metrics:
     """Metrics collection service."""
 
+    __slots__ = ("enabled", "endpoint")
+
     def __init__(self, enabled: bool, endpoint: str) -> None:
         self.enabled = enabled
         self.endpoint = endpoint
@@ -74,6 +87,8 @@ class Metrics:
 class Application:
     """Main application with all dependencies."""
 
+    __slots__ = ("db", "logger", "metrics")
+
     def __init__(self, db: Database, logger: Logger, metrics: Metrics) -> None:
         self.db = db
         self.logger = logger
@@ -93,34 +108,43 @@ class Application:
 class EnvironmentModule(ProviderModule):
     """Provider module that adapts to different environments."""
 
+    # Per-environment settings; unknown environments fall back to development
+    DATABASE_SETTINGS = MappingProxyType(
+        {
+            "production": ("prod-db.example.com", 5432, "production_db", True),
+            "staging": ("staging-db.example.com", 5432, "staging_db", True),
+            "development": ("localhost", 5432, "dev_db", False),
+        }
+    )
+    LOGGER_SETTINGS = MappingProxyType(
+        {
+            "production": ("WARNING", "json"),
+            "staging": ("INFO", "json"),
+            "development": ("DEBUG", "text"),
+        }
+    )
+    METRICS_SETTINGS = MappingProxyType(
+        {
+            "production": (True, "https://metrics.example.com"),
+            "staging": (True, "https://metrics-staging.example.com"),
+            "development": (False, ""),
+        }
+    )
+
     def __init__(self, environment: str) -> None:
         """Initialize with environment (dev, staging, prod)."""
         self.environment = environment
+        # Pick the environment's settings once instead of branching per call
+        if environment not in self.DATABASE_SETTINGS:
+            environment = "development"
+        self._database_config = DatabaseConfig(*self.DATABASE_SETTINGS[environment])
+        self._logger_args = self.LOGGER_SETTINGS[environment]
+        self._metrics_args = self.METRICS_SETTINGS[environment]
 
     @provider
     def provide_database_config(self) -> DatabaseConfig:
         """Provide environment-specific database configuration."""
-        if self.environment == "production":
-            return DatabaseConfig(
-                host="prod-db.example.com",
-                port=5432,
-                database="production_db",
-                ssl_enabled=True,
-            )
-        elif self.environment == "staging":
-            return DatabaseConfig(
-                host="staging-db.example.com",
-                port=5432,
-                database="staging_db",
-                ssl_enabled=True,
-            )
-        else:  # development
-            return DatabaseConfig(
-                host="localhost",
-                port=5432,
-                database="dev_db",
-                ssl_enabled=False,
-            )
+        return self._database_config
 
     @provider
     def provide_database(self, config: DatabaseConfig) -> Database:
@@ -132,22 +156,12 @@ class EnvironmentModule(ProviderModule):
     @provider
     def provide_logger(self) -> Logger:
         """Provide environment-appropriate logger."""
-        if self.environment == "production":
-            return Logger(level="WARNING", format_string="json")
-        elif self.environment == "staging":
-            return Logger(level="INFO", format_string="json")
-        else:
-            return Logger(level="DEBUG", format_string="text")
+        return Logger(*self._logger_args)
 
     @provider
     def provide_metrics(self) -> Metrics:
         """Provide metrics service based on environment."""
-        if self.environment == "production":
-            return Metrics(enabled=True, endpoint="https://metrics.example.com")
-        elif self.environment == "staging":
-            return Metrics(enabled=True, endpoint="https://metrics-staging.example.com")
-        else:
-            return Metrics(enabled=False, endpoint="")
+        return Metrics(*self._metrics_args)
 
 
 # === Pattern 2: Provider with External Dependencies ===
@@ -210,12 +224,16 @@ def demo_environment_specific():
     print("🌍 Environment-Specific Providers")
     print("=" * 60)
 
+    # One container for all environments: ApplicationModule is installed once,
+    # and installing a new EnvironmentModule replaces the previous one's
+    # provider bindings (they share the same return types).
+    container = InjectQ()
+    container.install_module(ApplicationModule())
+
     for env in ["development", "staging", "production"]:
         print(f"\n--- {env.upper()} ---")
 
-        container = InjectQ()
         container.install_module(EnvironmentModule(environment=env))
-        container.install_module(ApplicationModule())
 
         app = container.get(Application)
         app.run()
@@ -320,15 +338,24 @@ def demo_singleton_providers():
     print("   Providers create singletons by default!")
 
 
+def run_buffered(demo):
+    """Run a demo, writing its output to stdout in a single write."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        demo()
+    sys.stdout.write(buffer.getvalue())
+    sys.stdout.flush()
+
+
 def main():
     """Run all demonstrations."""
     print("\n🚀 Advanced Provider Patterns")
     print("=" * 60)
 
-    demo_environment_specific()
-    demo_parameterized_providers()
-    demo_provider_composition()
-    demo_singleton_providers()
+    run_buffered(demo_environment_specific)
+    run_buffered(demo_parameterized_providers)
+    run_buffered(demo_provider_composition)
+    run_buffered(demo_singleton_providers)
 
     print("\n" + "=" * 60)
     print("✅ All demonstrations completed!")
@@ -10,6 +10,10 @@ These methods expand InjectQ's flexibility for advanced use cases.
 """
 
 import asyncio
+import contextlib
+import io
+import sys
+
 from injectq import InjectQ
 
 
@@ -17,6 +21,8 @@ from injectq import InjectQ
 class Database:
     """Mock database service."""
 
+    __slots__ = ("connection_string",)
+
     def __init__(self, connection_string: str = "localhost:5432"):
         self.connection_string = connection_string
 
@@ -27,6 +33,8 @@ class Database:
 class Cache:
     """Mock cache service."""
 
+    __slots__ = ("host",)
+
     def __init__(self, host: str = "localhost"):
         self.host = host
 
@@ -121,6 +129,21 @@ def demo_invoke_method() -> None:
     config2 = container.invoke("config", env="prod")
     print(f"Result 2: {config2}")
 
+    # Example 4: Typed key instead of a string tag
+    class ReportBuilder:
+        """Key type for the report factory."""
+
+    def create_report(db: Database, title: str) -> dict:
+        return {"title": title, "db": db.connection_string}
+
+    container.bind_factory(ReportBuilder, create_report)
+
+    print("\n📌 Typed factory key:")
+    print("container.bind_factory(ReportBuilder, create_report)")
+    report = container.invoke(ReportBuilder, title="Quarterly")
+    print(f"Result: {report}")
+    print("Note: type keys hash by identity and are visible to type checkers")
+
 
 # ============================================================================
 # Part 2: Async Factory Methods
@@ -233,6 +256,8 @@ async def real_world_example() -> None:
     class ConnectionPool:
         """Mock connection pool."""
 
+        __slots__ = ("db_name", "max_conn", "timeout")
+
         def __init__(self, db_name: str, max_conn: int = 10, timeout: int = 30) -> None:
             self.db_name = db_name
             self.max_conn = max_conn
@@ -258,18 +283,14 @@ async def real_world_example() -> None:
     print("\n📊 Creating multiple connection pools:")
     print("Strategy: Use ainvoke() to inject defaults, override per-pool")
 
-    # Create pools with different configs
-    users_pool = await container.ainvoke("db_pool", db_name="users_db")
-    print(f"Users Pool: {users_pool}")
-
-    orders_pool = await container.ainvoke(
-        "db_pool", db_name="orders_db", max_connections=20
+    # Create pools with different configs concurrently
+    users_pool, orders_pool, logs_pool = await asyncio.gather(
+        container.ainvoke("db_pool", db_name="users_db"),
+        container.ainvoke("db_pool", db_name="orders_db", max_connections=20),
+        container.ainvoke("db_pool", db_name="logs_db", timeout=10, max_connections=5),
     )
+    print(f"Users Pool: {users_pool}")
     print(f"Orders Pool: {orders_pool}")
-
-    logs_pool = await container.ainvoke(
-        "db_pool", db_name="logs_db", timeout=10, max_connections=5
-    )
     print(f"Logs Pool: {logs_pool}")
 
     print("\n✅ Each pool has custom settings while sharing base config!")
@@ -332,6 +353,17 @@ def comparison_demo() -> None:
 # ============================================================================
 
 
+async def run_buffered(demo) -> None:
+    """Run a sync or async demo, writing its output to stdout in one write."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        result = demo()
+        if asyncio.iscoroutine(result):
+            await result
+    sys.stdout.write(buffer.getvalue())
+    sys.stdout.flush()
+
+
 async def main() -> None:
     """Run all demonstrations."""
     print("\n" + "🚀" * 35)
@@ -339,19 +371,19 @@ async def main() -> None:
     print("🚀" * 35)
 
     # Part 1: invoke()
-    demo_invoke_method()
+    await run_buffered(demo_invoke_method)
 
     # Part 2: Async methods
-    await demo_async_factory_methods()
+    await run_buffered(demo_async_factory_methods)
 
     # Part 3: ainvoke()
-    await demo_ainvoke_method()
+    await run_buffered(demo_ainvoke_method)
 
     # Part 4: Real-world example
-    await real_world_example()
+    await run_buffered(real_world_example)
 
     # Part 5: Comparison
-    comparison_demo()
+    await run_buffered(comparison_demo)
 
     # Summary
     print("\n" + "=" * 70)
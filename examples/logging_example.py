@@ -127,6 +127,35 @@ def disabled_logging_example() -> None:
     print("(No log messages appeared - logging is silent by default)")
 
 
+# Example 5: Guarding expensive debug logging in hot paths
+def guarded_logging_example() -> None:
+    """Show the isEnabledFor guard used on InjectQ's resolution path."""
+    print("\n" + "=" * 60)
+    print("Example 5: Guarded Debug Logging")
+    print("=" * 60)
+    print("InjectQ wraps per-resolution debug logs in isEnabledFor(DEBUG),")
+    print("so resolving with DEBUG off skips the logging call entirely.\n")
+
+    app_logger = logging.getLogger("myapp.services")
+    container = InjectQ()
+
+    @singleton
+    class ReportService:
+        def __init__(self) -> None:
+            self.reports: list[str] = []
+
+    container.bind(ReportService, ReportService)
+
+    # Use the same guard for debug logs in your own providers and
+    # injected functions that run on every request.
+    for _ in range(3):
+        service = container.get(ReportService)
+        if app_logger.isEnabledFor(logging.DEBUG):
+            app_logger.debug("Resolved %s", type(service).__name__)
+
+    print(f"Debug enabled for myapp: {app_logger.isEnabledFor(logging.DEBUG)}")
+
+
 if __name__ == "__main__":
     print("\n" + "=" * 60)
     print("InjectQ Logging Examples")
@@ -137,6 +166,7 @@ if __name__ == "__main__":
 
     # Run examples
     disabled_logging_example()
+    guarded_logging_example()
     basic_logging_example()
     tortoise_style_example()
     advanced_logging_example()
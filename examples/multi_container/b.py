@@ -12,9 +12,10 @@ class Agent:
         self.name = name
         # Use provided container or fallback to global convenience container
         self.container = container or InjectQ.get_instance()
-        self.container.bind("agent_name", self.name)
-        # Bind the agent instance to the container for injection
-        self.container.bind(Agent, self)
+        # Bind the agent and its name for injection in one locked batch
+        with self.container.batch_bind() as bindings:
+            bindings["agent_name"] = self.name
+            bindings[Agent] = self
         self.container.activate()
 
     def test(self) -> None:
@@ -15,6 +15,11 @@ from injectq import InjectQ
 from injectq.modules import ProviderModule, provider
 
 
+# Set to False to silence the services' own output, e.g. when timing
+# resolution with these classes as benchmark scaffolding
+VERBOSE = True
+
+
 # === Domain Models ===
 
 
@@ -41,12 +46,14 @@ class Database:
         self.config = config
         self.pool_size = pool_size
         self.connected = False
-        print(f"🔌 Database created with config: {config}")
+        if VERBOSE:
+            print(f"🔌 Database created with config: {config}")
 
     def connect(self) -> None:
         """Establish database connection."""
         self.connected = True
-        print(f"✅ Connected to {self.config.connection_string}")
+        if VERBOSE:
+            print(f"✅ Connected to {self.config.connection_string}")
 
     def query(self, sql: str) -> dict:
         """Execute a query."""
@@ -73,7 +80,8 @@ class RedisCache:
         self.config = config
         self.redis_url = redis_url
         self.cache: dict = {}
-        print(f"💾 Redis cache created: {redis_url} with {config}")
+        if VERBOSE:
+            print(f"💾 Redis cache created: {redis_url} with {config}")
 
     def get(self, key: str) -> str | None:
         """Get value from cache."""
@@ -97,7 +105,8 @@ class Logger:
 
     def log(self, message: str) -> None:
         """Log a message."""
-        print(f"[{self.level}] {self.name}: {message}")
+        if VERBOSE:
+            print(f"[{self.level}] {self.name}: {message}")
 
 
 class UserService:
@@ -200,9 +209,22 @@ class AdvancedProviderModule(ProviderModule):
     Advanced provider module showing conditional logic and transformations.
     """
 
+    # Per-environment (host, port, database name suffix); any other
+    # environment gets the development settings
+    DATABASE_SETTINGS = {
+        "production": ("prod-db.example.com", 5432, ""),
+        "staging": ("staging-db.example.com", 5432, "_staging"),
+        "development": ("localhost", 5432, "_dev"),
+    }
+
     def __init__(self, environment: str):
         """Initialize with environment context."""
         self.environment = environment
+        # Pick the environment's settings once instead of branching per call
+        self._db_host, self._db_port, self._db_suffix = self.DATABASE_SETTINGS.get(
+            environment, self.DATABASE_SETTINGS["development"]
+        )
+        self._log_level = "DEBUG" if environment == "development" else "INFO"
 
     @provider
     def provide_database_config(self, base_db_name: str) -> DatabaseConfig:
@@ -212,28 +234,16 @@ class AdvancedProviderModule(ProviderModule):
         This shows how providers can use module state to
         customize dependency creation.
         """
-        # Different config based on environment
-        if self.environment == "production":
-            return DatabaseConfig(
-                host="prod-db.example.com", port=5432, database=base_db_name
-            )
-        elif self.environment == "staging":
-            return DatabaseConfig(
-                host="staging-db.example.com",
-                port=5432,
-                database=f"{base_db_name}_staging",
-            )
-        else:  # development
-            return DatabaseConfig(
-                host="localhost", port=5432, database=f"{base_db_name}_dev"
-            )
+        return DatabaseConfig(
+            host=self._db_host,
+            port=self._db_port,
+            database=f"{base_db_name}{self._db_suffix}",
+        )
 
     @provider
     def provide_logger(self, app_name: str) -> Logger:
         """Provide environment-appropriate logger."""
-        # Different log levels based on environment
-        level = "DEBUG" if self.environment == "development" else "INFO"
-        return Logger(name=f"{app_name}[{self.environment}]", level=level)
+        return Logger(name=f"{app_name}[{self.environment}]", level=self._log_level)
 
 
 # === Demonstration Functions ===
@@ -328,7 +338,8 @@ def demo_provider_with_factories():
     class CacheModule(ProviderModule):
         @provider
         def provide_cache(self, config: CacheConfig, redis_url: str) -> RedisCache:
-            print("⚙️  Provider creating RedisCache...")
+            if VERBOSE:
+                print("⚙️  Provider creating RedisCache...")
             return RedisCache(config=config, redis_url=redis_url)
 
     container.install_module(CacheModule())
@@ -354,19 +365,22 @@ def demo_provider_dependency_chain():
         @provider
         def provide_level_1(self, base_value: str) -> str:
             result = f"Level1({base_value})"
-            print(f"  → {result}")
+            if VERBOSE:
+                print(f"  → {result}")
             return result
 
         @provider
         def provide_level_2(self, level_1: str) -> str:
             result = f"Level2({level_1})"
-            print(f"  → {result}")
+            if VERBOSE:
+                print(f"  → {result}")
             return result
 
         @provider
         def provide_level_3(self, level_2: str) -> str:
             result = f"Level3({level_2})"
-            print(f"  → {result}")
+            if VERBOSE:
+                print(f"  → {result}")
             return result
 
     container = InjectQ()
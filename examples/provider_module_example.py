@@ -9,6 +9,11 @@ from injectq import InjectQ
 from injectq.modules import ProviderModule, provider
 
 
+# Set to False to silence the services' own output, e.g. when timing
+# resolution with these classes as benchmark scaffolding
+VERBOSE = True
+
+
 # === Simple Domain Models ===
 
 
@@ -25,7 +30,8 @@ class ApiClient:
 
     def __init__(self, config: Config) -> None:
         self.config = config
-        print(f"✅ API Client initialized: {config.api_url}")
+        if VERBOSE:
+            print(f"✅ API Client initialized: {config.api_url}")
 
     def call(self, endpoint: str) -> dict:
         return {
@@ -41,7 +47,8 @@ class Service:
     def __init__(self, client: ApiClient, service_name: str) -> None:
         self.client = client
         self.name = service_name
-        print(f"✅ Service '{service_name}' initialized")
+        if VERBOSE:
+            print(f"✅ Service '{service_name}' initialized")
 
     def fetch_data(self, resource: str) -> dict:
         result = self.client.call(resource)
@@ -67,7 +74,8 @@ class AppModule(ProviderModule):
         The parameters (api_url, timeout) will be injected
         from bindings in the container.
         """
-        print("🔧 Creating Config...")
+        if VERBOSE:
+            print("🔧 Creating Config...")
         return Config(api_url=api_url, timeout=timeout)
 
     @provider
@@ -78,7 +86,8 @@ class AppModule(ProviderModule):
         The config parameter is injected - it's created by
         the provide_config provider above.
         """
-        print("🔧 Creating ApiClient...")
+        if VERBOSE:
+            print("🔧 Creating ApiClient...")
         return ApiClient(config=config)
 
     @provider
@@ -88,7 +97,8 @@ class AppModule(ProviderModule):
 
         Both client and service_name are injected.
         """
-        print("🔧 Creating Service...")
+        if VERBOSE:
+            print("🔧 Creating Service...")
         return Service(client=client, service_name=service_name)
 
 
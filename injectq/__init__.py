@@ -6,21 +6,10 @@ and the advanced features of modern DI frameworks.
 
 __version__ = "0.4.0"
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 # Core exports
-# Testing exports
-from . import testing
-
-# Component exports
-from .components import (
-    Component,
-    ComponentBinding,
-    ComponentContainer,
-    ComponentError,
-    ComponentInterface,
-    ComponentRegistry,
-    ComponentScope,
-    ComponentState,
-)
 from .core import (
     ContainerContext,
     InjectQ,
@@ -41,13 +30,6 @@ from .decorators import (
     singleton,
     transient,
 )
-
-# Diagnostics exports
-from .diagnostics import (
-    DependencyProfiler,
-    DependencyValidator,
-    DependencyVisualizer,
-)
 from .modules import (
     ConfigurationModule,
     Module,
@@ -81,7 +63,64 @@ from .utils import (
 )
 
 
-__all__ = [
+if TYPE_CHECKING:
+    from . import components, diagnostics, testing
+    from .components import (
+        Component,
+        ComponentBinding,
+        ComponentContainer,
+        ComponentError,
+        ComponentInterface,
+        ComponentRegistry,
+        ComponentScope,
+        ComponentState,
+    )
+    from .diagnostics import (
+        DependencyProfiler,
+        DependencyValidator,
+        DependencyVisualizer,
+    )
+
+
+# Components, diagnostics and testing helpers are not needed to build or
+# use a container, so they are imported on first access (PEP 562) instead
+# of on ``import injectq``.
+_LAZY_EXPORTS: dict[str, str] = {
+    "Component": ".components",
+    "ComponentBinding": ".components",
+    "ComponentContainer": ".components",
+    "ComponentError": ".components",
+    "ComponentInterface": ".components",
+    "ComponentRegistry": ".components",
+    "ComponentScope": ".components",
+    "ComponentState": ".components",
+    "DependencyProfiler": ".diagnostics",
+    "DependencyValidator": ".diagnostics",
+    "DependencyVisualizer": ".diagnostics",
+    # Subpackages themselves, reachable as attributes like at import time
+    "components": ".components",
+    "diagnostics": ".diagnostics",
+    "testing": ".testing",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    module = importlib.import_module(module_name, __name__)
+    value = module if module_name == f".{name}" else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+__all__ = (
     "AsyncFactory",
     "AsyncProvider",
     "AsyncResourceProvider",
@@ -141,4 +180,4 @@ __all__ = [
     # Testing
     "testing",
     "transient",
-]
+)
@@ -13,8 +13,11 @@ Key Features:
 
 import asyncio
 import contextlib
+import functools
+import heapq
 import logging
-from collections.abc import Callable
+import weakref
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import (
@@ -36,6 +39,16 @@ _logger = logging.getLogger("injectq.components")
 
 T = TypeVar("T")
 
+# Interface inferred for each component class by ComponentBinding, so
+# re-registering a class does not re-run get_type_hints; keyed weakly so
+# classes created at runtime (tests, hot reload) can still be collected
+_interface_cache: weakref.WeakKeyDictionary[type, type | None] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Sentinel for scope cache misses, so a cached None is still a hit
+_MISSING = object()
+
 
 class ComponentError(InjectQError):
     """Errors related to component architecture."""
@@ -76,70 +89,106 @@ class ComponentInterface(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentBinding:
     """Represents a component binding configuration."""
 
     component_type: type
     interface: type | None = None
     scope: str = "singleton"
-    dependencies: set[type] = field(default_factory=set)
-    provided_interfaces: set[type] = field(default_factory=set)
+    dependencies: frozenset[type] = frozenset()
+    provided_interfaces: frozenset[type] = frozenset()
     configuration: dict[str, Any] = field(default_factory=dict)
-    tags: set[str] = field(default_factory=set)
+    tags: frozenset[str] = frozenset()
     priority: int = 0
     auto_start: bool = True
+    name: str = ""
+    # Type names resolved once, for the registry's name-keyed graphs
+    provided_interface_names: tuple[str, ...] = field(init=False, default=())
+    dependency_names: tuple[str, ...] = field(init=False, default=())
 
     def __post_init__(self) -> None:
         """Post-initialization processing."""
+        self.provided_interface_names = tuple(
+            iface.__name__ for iface in self.provided_interfaces
+        )
+        self.dependency_names = tuple(dep.__name__ for dep in self.dependencies)
         if self.interface is None:
-            # Try to infer interface from type hints
             try:
-                get_type_hints(self.component_type)
-                for base in getattr(self.component_type, "__bases__", []):
-                    if hasattr(base, "__annotations__"):
-                        self.interface = base
-                        break
-            except (TypeError, NameError):
-                pass  # Ignore type hint errors
+                self.interface = _interface_cache[self.component_type]
+            except KeyError:
+                self.interface = _interface_cache[self.component_type] = (
+                    _infer_interface(self.component_type)
+                )
+
+
+def _frozen(values: Any) -> frozenset:
+    """Return component metadata as a frozenset, reusing frozensets as-is."""
+    return values if type(values) is frozenset else frozenset(values)
+
+
+def _infer_interface(component_type: type) -> type | None:
+    """Infer a component's interface from its annotated base classes."""
+    try:
+        get_type_hints(component_type)
+    except (TypeError, NameError):
+        return None  # Ignore type hint errors
+    for base in getattr(component_type, "__bases__", []):
+        if hasattr(base, "__annotations__"):
+            return base
+    return None
 
 
 class ComponentScope(Scope):
     """Component-specific scope for managing component instances."""
 
     def __init__(self, component_name: str) -> None:
-        super().__init__(f"component:{component_name}")
+        # Component scopes never take the scope lock, so none is built
+        super().__init__(f"component:{component_name}", thread_safe=False)
         self.component_name = component_name
         self._instances: dict[str, Any] = {}
+        # (stop, destroy) callables of each created instance, looked up once
+        # when the instance is stored rather than on every clear()
+        self._lifecycle: list[tuple[Callable | None, Callable | None]] = []
+
+    def _store(self, key: str, instance: Any) -> None:
+        self._instances[key] = instance
+        self._lifecycle.append(
+            (getattr(instance, "stop", None), getattr(instance, "destroy", None))
+        )
 
     def get(self, key: str, factory: Callable[[], Any]) -> Any:
         """Get or create a component-scoped instance."""
-        if key not in self._instances:
-            self._instances[key] = factory()
-        return self._instances[key]
+        instance = self._instances.get(key, _MISSING)
+        if instance is _MISSING:
+            instance = factory()
+            self._store(key, instance)
+        return instance
 
     async def aget(self, key: str, factory: Callable[[], Any]) -> Any:
         """Async get or create a component-scoped instance."""
-        if key not in self._instances:
-            result = factory()
-            if asyncio.iscoroutine(result):
-                result = await result
-            self._instances[key] = result
-        return self._instances[key]
+        instance = self._instances.get(key, _MISSING)
+        if instance is _MISSING:
+            instance = factory()
+            if asyncio.iscoroutine(instance):
+                instance = await instance
+            self._store(key, instance)
+        return instance
 
     def clear(self) -> None:
         """Clear all component-scoped instances."""
         _logger.debug("Clearing component scope: %s", self.component_name)
 
-        for instance in self._instances.values():
-            if hasattr(instance, "stop"):
+        for stop, destroy in self._lifecycle:
+            if stop is not None:
                 with contextlib.suppress(Exception):
-                    instance.stop()
-            if hasattr(instance, "destroy"):
+                    stop()
+            if destroy is not None:
                 with contextlib.suppress(Exception):
-                    instance.destroy()
+                    destroy()
 
         self._instances.clear()
+        self._lifecycle.clear()
         _logger.debug("Component scope cleared: %s", self.component_name)
 
 
@@ -151,9 +200,9 @@ class Component:
 
     Attributes:
         name: Component name.
-        provides: List of interfaces this component provides.
-        requires: List of dependencies required by this component.
-        tags: Set of tags for organizing components.
+        provides: Interfaces this component provides.
+        requires: Dependencies required by this component.
+        tags: Tags for organizing components.
         auto_start: Whether component starts automatically.
 
     Example:
@@ -180,9 +229,9 @@ class Component:
 
     # Component metadata (can be overridden in subclasses)
     name: str = ""
-    provides: list[type] = []  # noqa: RUF012
-    requires: list[type] = []  # noqa: RUF012
-    tags: set[str] = set()  # noqa: RUF012
+    provides: tuple[type, ...] | list[type] = ()
+    requires: tuple[type, ...] | list[type] = ()
+    tags: frozenset[str] | set[str] = frozenset()
     auto_start: bool = True
 
     def __init__(self) -> None:
@@ -231,11 +280,12 @@ class Component:
             raise ComponentError(msg)
 
         if dependency_type not in self._dependencies:
-            _logger.debug(
-                "Resolving dependency %s for component %s",
-                dependency_type.__name__,
-                self.name,
-            )
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    "Resolving dependency %s for component %s",
+                    dependency_type.__name__,
+                    self.name,
+                )
             self._dependencies[dependency_type] = self.container.get(dependency_type)
 
         return self._dependencies[dependency_type]
@@ -269,9 +319,10 @@ class Component:
             _logger.error("Configuration failed: %s", msg)
             raise ComponentError(msg)
 
-        _logger.debug(
-            "Configuring component %s with args: %s", self.name, list(kwargs.keys())
-        )
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "Configuring component %s with args: %s", self.name, list(kwargs)
+            )
         # Store configuration
         for key, value in kwargs.items():
             setattr(self, key, value)
@@ -339,8 +390,17 @@ class ComponentRegistry:
     def __init__(self) -> None:
         self._bindings: dict[str, ComponentBinding] = {}
         self._instances: dict[str, Component] = {}
-        self._dependency_graph: dict[str, set[str]] = {}
-        self._reverse_graph: dict[str, set[str]] = {}
+        # Component name -> names of the interfaces it requires
+        self._dependency_graph: dict[str, tuple[str, ...]] = {}
+        # Interface name -> first registered component providing it
+        self._interface_providers: dict[str, str] = {}
+        # Bindings indexed by provided interface and by tag, in registration
+        # order, for the get_bindings_by_* lookups
+        self._by_interface: dict[type, list[ComponentBinding]] = {}
+        self._by_tag: dict[str, list[ComponentBinding]] = {}
+        # Computed orders, reset whenever the registrations change
+        self._startup_order_cache: tuple[str, ...] | None = None
+        self._shutdown_order_cache: tuple[str, ...] | None = None
 
     def register(
         self,
@@ -410,14 +470,14 @@ class ComponentRegistry:
         )
 
         # Extract component metadata
-        provides = set(getattr(component_class, "provides", []))
-        requires = set(getattr(component_class, "requires", []))
-        component_tags = set(getattr(component_class, "tags", set()))
+        provides = _frozen(getattr(component_class, "provides", ()))
+        requires = _frozen(getattr(component_class, "requires", ()))
+        component_tags = _frozen(getattr(component_class, "tags", frozenset()))
         component_auto_start = getattr(component_class, "auto_start", True)
 
         # Merge with provided parameters
         if tags:
-            component_tags.update(tags)
+            component_tags = component_tags.union(tags)
         if configuration is None:
             configuration = {}
 
@@ -439,22 +499,65 @@ class ComponentRegistry:
             tags=component_tags,
             priority=priority,
             auto_start=auto_start and component_auto_start,
+            name=component_name,
         )
 
+        previous = self._bindings.get(component_name)
+        if previous is not None:
+            self._unindex(previous)
+
         self._bindings[component_name] = binding
+        for iface, iface_name in zip(
+            binding.provided_interfaces, binding.provided_interface_names, strict=True
+        ):
+            self._interface_providers.setdefault(iface_name, component_name)
+            self._by_interface.setdefault(iface, []).append(binding)
+        if previous is not None:
+            # The replaced binding may have provided interfaces the new one
+            # does not, so pick the provider of each affected one again
+            self._reassign_providers(
+                {*previous.provided_interface_names, *binding.provided_interface_names}
+            )
+        for tag in component_tags:
+            self._by_tag.setdefault(tag, []).append(binding)
 
         # Update dependency graph
-        self._dependency_graph[component_name] = {dep.__name__ for dep in requires}
+        self._dependency_graph[component_name] = binding.dependency_names
 
-        # Update reverse dependency graph
-        for dep_name in self._dependency_graph[component_name]:
-            if dep_name not in self._reverse_graph:
-                self._reverse_graph[dep_name] = set()
-            self._reverse_graph[dep_name].add(component_name)
+        self._startup_order_cache = self._shutdown_order_cache = None
 
         _logger.debug("Component registered successfully: %s", component_name)
         return binding
 
+    def _unindex(self, binding: ComponentBinding) -> None:
+        """Remove a replaced binding from the interface and tag indexes."""
+        for iface in binding.provided_interfaces:
+            bindings = self._by_interface[iface]
+            bindings.remove(binding)
+            if not bindings:
+                del self._by_interface[iface]
+        for tag in binding.tags:
+            bindings = self._by_tag[tag]
+            bindings.remove(binding)
+            if not bindings:
+                del self._by_tag[tag]
+
+    def _reassign_providers(self, interface_names: set[str]) -> None:
+        """Point each interface at the first registered component providing it."""
+        for iface_name in interface_names:
+            provider = next(
+                (
+                    name
+                    for name, binding in self._bindings.items()
+                    if iface_name in binding.provided_interface_names
+                ),
+                None,
+            )
+            if provider is None:
+                self._interface_providers.pop(iface_name, None)
+            else:
+                self._interface_providers[iface_name] = provider
+
     def get_binding(self, name: str) -> ComponentBinding | None:
         """Get a component binding by name.
 
@@ -464,7 +567,6 @@ class ComponentRegistry:
         Returns:
             ComponentBinding or None if not found.
         """
-        _logger.debug("Retrieving component binding: %s", name)
         return self._bindings.get(name)
 
     def get_bindings_by_tag(self, tag: str) -> list[ComponentBinding]:
@@ -476,10 +578,7 @@ class ComponentRegistry:
         Returns:
             List of component bindings with the specified tag.
         """
-        _logger.debug("Retrieving component bindings by tag: %s", tag)
-        result = [binding for binding in self._bindings.values() if tag in binding.tags]
-        _logger.debug("Found %d component binding(s) with tag '%s'", len(result), tag)
-        return result
+        return list(self._by_tag.get(tag, ()))
 
     def get_bindings_by_interface(self, interface: type) -> list[ComponentBinding]:
         """Get all component bindings that provide a specific interface.
@@ -490,76 +589,79 @@ class ComponentRegistry:
         Returns:
             List of component bindings providing the interface.
         """
-        iface_name = interface.__name__
-        _logger.debug("Retrieving component bindings by interface: %s", iface_name)
-        result = [
-            binding
-            for binding in self._bindings.values()
-            if interface in binding.provided_interfaces
-        ]
-        _logger.debug(
-            "Found %d component binding(s) for interface '%s'",
-            len(result),
-            iface_name,
-        )
-        return result
+        return list(self._by_interface.get(interface, ()))
 
     def get_startup_order(self) -> list[str]:
         """Get the component startup order based on dependencies.
 
+        The order is cached until the next registration or clear().
+
         Returns:
             List of component names in startup order.
 
         Raises:
             ComponentError: If circular dependencies detected.
         """
-        _logger.debug("Computing component startup order")
-        visited = set()
-        temp_visited = set()
-        order = []
+        if self._startup_order_cache is not None:
+            return list(self._startup_order_cache)
 
-        def visit(name: str) -> None:
-            if name in temp_visited:
-                msg = f"Circular dependency detected involving component '{name}'"
-                _logger.error("Circular dependency: %s", msg)
-                raise ComponentError(msg)
-
-            if name not in visited:
-                temp_visited.add(name)
-
-                # Visit dependencies first
-                for dep_name in self._dependency_graph.get(name, set()):
-                    # Find component that provides this dependency
-                    provider = None
-                    for comp_name, binding in self._bindings.items():
-                        if any(
-                            dep.__name__ == dep_name
-                            for dep in binding.provided_interfaces
-                        ):
-                            provider = comp_name
-                            break
-
-                    if provider and provider in self._bindings:
-                        visit(provider)
-
-                temp_visited.remove(name)
-                visited.add(name)
-                order.append(name)
-
-        # Sort by priority first
-        sorted_components = sorted(
-            self._bindings.keys(),
-            key=lambda name: self._bindings[name].priority,
-            reverse=True,
-        )
+        _logger.debug("Computing component startup order")
+        bindings = self._bindings
+        providers = self._interface_providers
+
+        # Kahn's algorithm over edges from each provider to its dependents
+        in_degree = dict.fromkeys(bindings, 0)
+        dependents: dict[str, list[str]] = {}
+        for name in bindings:
+            required = {
+                provider
+                for dep_name in self._dependency_graph.get(name, ())
+                if (provider := providers.get(dep_name)) is not None
+            }
+            for provider in required:
+                in_degree[name] += 1
+                dependents.setdefault(provider, []).append(name)
+
+        # Ready components start by priority, then in registration order
+        rank = {
+            name: (-binding.priority, index)
+            for index, (name, binding) in enumerate(bindings.items())
+        }
+        ready = [(rank[name], name) for name, degree in in_degree.items() if not degree]
+        heapq.heapify(ready)
 
-        for name in sorted_components:
-            if name not in visited:
-                visit(name)
+        order = []
+        while ready:
+            _, name = heapq.heappop(ready)
+            order.append(name)
+            for dependent in dependents.get(name, ()):
+                in_degree[dependent] -= 1
+                if not in_degree[dependent]:
+                    heapq.heappush(ready, (rank[dependent], dependent))
+
+        if len(order) != len(bindings):
+            blocked = ", ".join(name for name, degree in in_degree.items() if degree)
+            msg = f"Circular dependency detected involving components: {blocked}"
+            _logger.error("Circular dependency: %s", msg)
+            raise ComponentError(msg)
 
         _logger.debug("Startup order determined: %s", order)
+        self._startup_order_cache = tuple(order)
         return order
 
+    def get_shutdown_order(self) -> list[str]:
+        """Get the component shutdown order (reverse of the startup order).
+
+        Returns:
+            List of component names in shutdown order.
+
+        Raises:
+            ComponentError: If circular dependencies detected.
+        """
+        if self._shutdown_order_cache is None:
+            self._shutdown_order_cache = tuple(reversed(self.get_startup_order()))
+        return list(self._shutdown_order_cache)
+
     def create_instance(self, name: str, container: InjectQ) -> Component:
         """Create a component instance.
 
@@ -573,7 +675,11 @@ class ComponentRegistry:
         Raises:
             ComponentError: If component binding not found.
         """
-        _logger.debug("Creating instance for component: %s", name)
+        # Existing instances are returned on every resolution through the
+        # container factory, so this path stays free of logging
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
 
         binding = self._bindings.get(name)
         if not binding:
@@ -581,13 +687,12 @@ class ComponentRegistry:
             _logger.error("Instance creation failed: %s", msg)
             raise ComponentError(msg)
 
-        if name in self._instances:
-            _logger.debug("Component instance already exists: %s", name)
-            return self._instances[name]
-
         # Create instance
-        class_name = binding.component_type.__name__
-        _logger.debug("Instantiating component class: %s", class_name)
+        _logger.debug(
+            "Instantiating component class %s for component: %s",
+            binding.component_type.__name__,
+            name,
+        )
         instance = binding.component_type()
         instance.set_container(container)
 
@@ -611,15 +716,7 @@ class ComponentRegistry:
         Returns:
             Component instance or None if not found.
         """
-        _logger.debug("Retrieving component instance: %s", name)
-        instance = self._instances.get(name)
-        if instance:
-            _logger.debug(
-                "Component instance found: %s (state: %s)", name, instance.state
-            )
-        else:
-            _logger.debug("Component instance not found: %s", name)
-        return instance
+        return self._instances.get(name)
 
     def list_components(self) -> list[str]:
         """List all registered component names.
@@ -627,10 +724,7 @@ class ComponentRegistry:
         Returns:
             List of component names.
         """
-        _logger.debug("Listing all registered components")
-        names = list(self._bindings.keys())
-        _logger.debug("Found %d registered component(s)", len(names))
-        return names
+        return list(self._bindings.keys())
 
     def clear(self) -> None:
         """Clear all registrations and instances."""
@@ -643,7 +737,10 @@ class ComponentRegistry:
         self._bindings.clear()
         self._instances.clear()
         self._dependency_graph.clear()
-        self._reverse_graph.clear()
+        self._interface_providers.clear()
+        self._by_interface.clear()
+        self._by_tag.clear()
+        self._startup_order_cache = self._shutdown_order_cache = None
 
         _logger.debug("Component registry cleared")
 
@@ -685,34 +782,27 @@ class ComponentContainer(InjectQ):
 
         binding = self.component_registry.register(component_class, name, **kwargs)
 
-        # Compute the component name (same logic as in register)
-        component_name = (
-            name
-            or getattr(component_class, "name", None)
-            or component_class.__name__.lower()
-        )
+        component_name = binding.name
 
         # Register provided interfaces with the container
         for interface in binding.provided_interfaces:
+            self.bind_factory(
+                interface, functools.partial(self._component_factory, component_name)
+            )
 
-            def component_factory(
-                comp_name: str = component_name,
-            ) -> Component:
-                """Factory to create or get the component instance.
-
-                Args:
-                    comp_name: Name of the component to create/get.
+        _logger.info("Component registered with container: %s", component_name)
+        return binding
 
-                Returns:
-                    Component instance.
-                """
-                _logger.debug("Factory creating component: %s", comp_name)
-                return self.component_registry.create_instance(comp_name, self)
+    def _component_factory(self, comp_name: str) -> Component:
+        """Factory to create or get the component instance.
 
-            self.bind_factory(interface, component_factory)
+        Args:
+            comp_name: Name of the component to create/get.
 
-        _logger.info("Component registered with container: %s", component_name)
-        return binding
+        Returns:
+            Component instance.
+        """
+        return self.component_registry.create_instance(comp_name, self)
 
     def start_components(self, component_names: list[str] | None = None) -> None:
         """Start components in dependency order.
@@ -721,36 +811,44 @@ class ComponentContainer(InjectQ):
             component_names: Specific components to start. Defaults to all
                 auto-start components.
         """
+        registry = self.component_registry
+        to_create: Iterable[str]
         if component_names is None:
-            # Get all auto-start components
+            # Get all auto-start components, creating instances for every
+            # registered component
             component_names = [
                 name
-                for name, binding in self.component_registry._bindings.items()  # noqa: SLF001
+                for name, binding in registry._bindings.items()  # noqa: SLF001
                 if binding.auto_start
             ]
+            to_create = registry.list_components()
+            components_to_start = set(component_names)
+        else:
+            # Only the requested components and their dependencies
+            components_to_start = set(component_names)
+            to_create = components_to_start
 
         _logger.info("Starting %d component(s)", len(component_names))
 
         # Get startup order
-        startup_order = self.component_registry.get_startup_order()
+        startup_order = registry.get_startup_order()
 
-        # Create instances for all registered components
-        for name in self.component_registry.list_components():
-            if name not in self.component_registry._instances:  # noqa: SLF001
-                self.component_registry.create_instance(name, self)
-
-        # Filter to requested components and their dependencies
-        components_to_start = set(component_names)
         for name in component_names:
             # Add dependencies
             self._add_dependencies(name, components_to_start)
 
-        _logger.debug("Component startup sequence: %s", list(components_to_start))
+        instances = registry._instances  # noqa: SLF001
+        for name in to_create:
+            if name not in instances and registry.get_binding(name) is not None:
+                registry.create_instance(name, self)
+
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Component startup sequence: %s", list(components_to_start))
 
         # Start components in order
         for name in startup_order:
             if name in components_to_start:
-                instance = self.component_registry.get_instance(name)
+                instance = registry.get_instance(name)
                 if instance and instance.state in (
                     ComponentState.CONFIGURED,
                     ComponentState.STOPPED,
@@ -767,19 +865,20 @@ class ComponentContainer(InjectQ):
             component_names: Specific components to stop. Defaults to all.
         """
         if component_names is None:
-            component_names = list(self.component_registry._instances.keys())  # noqa: SLF001
+            to_stop = set(self.component_registry._instances)  # noqa: SLF001
+        else:
+            to_stop = set(component_names)
 
-        _logger.info("Stopping %d component(s)", len(component_names))
+        _logger.info("Stopping %d component(s)", len(to_stop))
 
         # Get shutdown order (reverse of startup)
-        startup_order = self.component_registry.get_startup_order()
-        shutdown_order = list(reversed(startup_order))
+        shutdown_order = self.component_registry.get_shutdown_order()
 
         _logger.debug("Component shutdown sequence: %s", shutdown_order)
 
         # Stop components
         for name in shutdown_order:
-            if name in component_names:
+            if name in to_stop:
                 instance = self.component_registry.get_instance(name)
                 if instance and instance.state == ComponentState.STARTED:
                     _logger.debug("Stopping component: %s", name)
@@ -788,19 +887,31 @@ class ComponentContainer(InjectQ):
         _logger.info("Components stopped successfully")
 
     def _add_dependencies(self, component_name: str, target_set: set[str]) -> None:
-        """Recursively add dependencies to the target set.
+        """Add the transitive dependencies of a component to the target set.
+
+        Required interfaces are mapped to the components providing them;
+        interfaces no registered component provides are skipped. The graph
+        is walked with an explicit stack, so deep chains do not grow the
+        Python call stack.
 
         Args:
             component_name: Component name to add dependencies for.
             target_set: Target set to add dependencies to.
         """
-        _logger.debug("Adding dependencies for component: %s", component_name)
         dep_graph = self.component_registry._dependency_graph  # noqa: SLF001
-        for dep_name in dep_graph.get(component_name, set()):
-            if dep_name not in target_set:
-                _logger.debug("Adding dependency: %s -> %s", component_name, dep_name)
-                target_set.add(dep_name)
-                self._add_dependencies(dep_name, target_set)
+        providers = self.component_registry._interface_providers  # noqa: SLF001
+        stack = [component_name]
+        while stack:
+            current = stack.pop()
+            for dep_name in dep_graph.get(current, ()):
+                provider = providers.get(dep_name)
+                if provider is not None and provider not in target_set:
+                    target_set.add(provider)
+                    stack.append(provider)
+
+        _logger.debug(
+            "Dependencies added for component %s: %s", component_name, target_set
+        )
 
     def get_component(self, name: str) -> Component | None:
         """Get a component instance by name.
@@ -811,7 +922,6 @@ class ComponentContainer(InjectQ):
         Returns:
             Component instance or None if not found.
         """
-        _logger.debug("Retrieving component: %s", name)
         return self.component_registry.get_instance(name)
 
     def resolve(self, service_type: type[T]) -> T:
@@ -823,7 +933,6 @@ class ComponentContainer(InjectQ):
         Returns:
             The resolved service instance.
         """
-        _logger.debug("Resolving service: %s", service_type.__name__)
         return self.get(service_type)
 
     def list_components(self) -> dict[str, ComponentState]:
@@ -832,7 +941,6 @@ class ComponentContainer(InjectQ):
         Returns:
             Dictionary mapping component names to their states.
         """
-        _logger.debug("Listing all components")
         result = {}
         for name in self.component_registry.list_components():
             instance = self.component_registry.get_instance(name)
@@ -3,6 +3,7 @@
 import asyncio
 import contextvars
 import logging
+import sys
 import threading
 from collections.abc import AsyncIterator, Callable, Iterator
 from contextlib import asynccontextmanager, contextmanager
@@ -11,7 +12,7 @@ from typing import Any
 from injectq.utils import ScopeError
 
 from .base_scope_manager import BaseScopeManager
-from .scopes import Scope, ThreadLocalScope
+from .scopes import _SCOPE_NAMES, Scope, ThreadLocalScope
 
 
 _logger = logging.getLogger("injectq.core")
@@ -171,6 +172,8 @@ class AsyncScopeManager(BaseScopeManager):
 
     def __init__(self) -> None:
         self._scopes: dict[str, Scope] = {}
+        # Scopes created on first use, so unused ones cost nothing
+        self._scope_factories: dict[str, Callable[[], Scope]] = {}
 
         # Use contextvars for async context isolation
         self._current_scopes_var: contextvars.ContextVar[list] = contextvars.ContextVar(
@@ -205,19 +208,41 @@ class AsyncScopeManager(BaseScopeManager):
 
     def register_scope(self, scope: Scope) -> None:
         """Register a new scope."""
-        self._scopes[scope.name] = scope
+        self._scopes[sys.intern(scope.name)] = scope
+
+    def register_scope_factory(
+        self, scope_name: str, factory: Callable[[], Scope]
+    ) -> None:
+        """Register a scope that is created by ``factory`` on first use."""
+        name = self.resolve_scope_name(scope_name)
+        self._scopes.pop(name, None)
+        self._scope_factories[name] = factory
 
     def get_scope(self, scope_name: str) -> Scope:
         """Get a scope by name."""
-        if scope_name not in self._scopes:
-            msg = f"Unknown scope: {scope_name}"
-            raise ScopeError(msg)
-        return self._scopes[scope_name]
+        scope = self._scopes.get(scope_name)
+        if scope is None:
+            factory = self._scope_factories.get(scope_name)
+            if factory is None:
+                msg = f"Unknown scope: {scope_name}"
+                raise ScopeError(msg)
+            # setdefault keeps one instance if threads race to create it
+            scope = self._scopes.setdefault(
+                _SCOPE_NAMES.get(scope_name, scope_name), factory()
+            )
+        return scope
 
     def resolve_scope_name(self, scope: Any) -> str:
         """Resolve scope name from various input types."""
+        try:
+            name = _SCOPE_NAMES.get(scope)
+        except TypeError:
+            # Unhashable input; reported as an invalid scope type below
+            name = None
+        if name is not None:
+            return name
         if isinstance(scope, str):
-            return scope
+            return sys.intern(scope)
         if hasattr(scope, "value"):  # ScopeType enum
             return scope.value
         if isinstance(scope, Scope):
@@ -294,16 +319,16 @@ def create_enhanced_scope_manager() -> AsyncScopeManager:
     from .scopes import SingletonScope, TransientScope
 
     # Register core scopes
-    manager.register_scope(SingletonScope())
-    manager.register_scope(TransientScope())
+    manager.register_scope_factory("singleton", SingletonScope)
+    manager.register_scope_factory("transient", TransientScope)
 
     # Register async-aware scopes
-    manager.register_scope(HybridRequestScope())
-    manager.register_scope(HybridActionScope())
+    manager.register_scope_factory("request", HybridRequestScope)
+    manager.register_scope_factory("action", HybridActionScope)
 
     # Register pure async scopes
-    manager.register_scope(AsyncRequestScope())
-    manager.register_scope(AsyncActionScope())
+    manager.register_scope_factory("async_request", AsyncRequestScope)
+    manager.register_scope_factory("async_action", AsyncActionScope)
 
     return manager
 
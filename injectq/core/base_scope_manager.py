@@ -8,6 +8,8 @@ from typing import Any
 class BaseScopeManager(ABC):
     """Abstract base class for scope managers."""
 
+    __slots__ = ()
+
     @abstractmethod
     def register_scope(self, scope: Any) -> None:
         """Register a new scope."""
@@ -2,37 +2,105 @@
 
 from __future__ import annotations
 
+import inspect
 import logging
+import weakref
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from injectq.utils import (
     BindingError,
     DependencyNotFoundError,
     ServiceFactory,
     ServiceKey,
+    get_signature,
 )
 
+from .context import ContainerContext
 from .registry import _UNSET, ServiceRegistry
 from .resolver import DependencyResolver
-from .scopes import ScopeManager, ScopeType
+from .scopes import ScopeManager, ScopeType, SingletonScope
 from .thread_safety import HybridLock
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator
+    from collections.abc import Callable, Iterable, Iterator
 
     from injectq.diagnostics import DependencyVisualizer
 
 
 _logger = logging.getLogger("injectq.core")
 
+# Primitive types that invoke() shouldn't auto-inject by type
+# (to avoid ambiguous injections like int, str, bool)
+_PRIMITIVE_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+class _InvokeParameter(NamedTuple):
+    """How invoke() fills one parameter of a factory."""
+
+    param_name: str
+    annotation: Any
+    # Resolve by annotation when no binding matches the name; never for
+    # primitive or missing annotations
+    inject_by_type: bool
+    required: bool
+
+
+_InvokePlan = tuple[_InvokeParameter, ...]
+
+
+def _build_invoke_plan(factory: Callable[..., Any]) -> _InvokePlan:
+    """Precompute how invoke() fills each parameter of a factory."""
+    plan = []
+    for param_name, param in get_signature(factory).parameters.items():
+        annotation = param.annotation
+        by_type = (
+            annotation is not inspect.Parameter.empty
+            and annotation not in _PRIMITIVE_TYPES
+        )
+        required = param.default is inspect.Parameter.empty and param.kind not in (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        )
+        plan.append(_InvokeParameter(param_name, annotation, by_type, required))
+    return tuple(plan)
+
+
+# Sentinel for memo misses, so a memoized None is still a hit
+_MISSING = object()
+
+# Keyed weakly, so a plan never keeps a discarded factory (or whatever it
+# closes over) alive
+_invoke_plans: weakref.WeakKeyDictionary[Callable[..., Any], _InvokePlan] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_invoke_plan(factory: Callable[..., Any]) -> _InvokePlan:
+    """Get the invoke plan for a factory, cached per factory."""
+    try:
+        plan = _invoke_plans.get(factory)
+    except TypeError:
+        # Factory cannot be weakly referenced; build the plan without caching
+        return _build_invoke_plan(factory)
+    if plan is None:
+        plan = _invoke_plans[factory] = _build_invoke_plan(factory)
+    return plan
+
 
 class FactoryProxy:
     """Proxy object for managing factory bindings with dict-like interface."""
 
+    __slots__ = ("_container", "_get_factory", "_has_factory", "_remove_factory")
+
     def __init__(self, container: InjectQ) -> None:
         self._container = container
+        # The registry lives as long as the container; bind its lookups once
+        registry = container._registry  # noqa: SLF001
+        self._get_factory = registry.get_factory
+        self._has_factory = registry.has_factory
+        self._remove_factory = registry.remove_factory
 
     def __setitem__(self, service_type: ServiceKey, factory: ServiceFactory) -> None:
         """Bind a factory function to a service type."""
@@ -40,7 +108,7 @@ class FactoryProxy:
 
     def __getitem__(self, service_type: ServiceKey) -> ServiceFactory:
         """Get a factory function for a service type."""
-        factory = self._container._registry.get_factory(service_type)  # noqa: SLF001
+        factory = self._get_factory(service_type)
         if factory is None:
             msg = f"No factory registered for {service_type}"
             raise KeyError(msg)
@@ -48,13 +116,13 @@ class FactoryProxy:
 
     def __delitem__(self, service_type: ServiceKey) -> None:
         """Remove a factory binding."""
-        if not self._container._registry.remove_factory(service_type):  # noqa: SLF001
+        if not self._remove_factory(service_type):
             msg = f"No factory registered for {service_type}"
             raise KeyError(msg)
 
     def __contains__(self, service_type: ServiceKey) -> bool:
         """Check if a factory is registered."""
-        return self._container._registry.has_factory(service_type)  # noqa: SLF001
+        return self._has_factory(service_type)
 
 
 class InjectQ:
@@ -68,6 +136,21 @@ class InjectQ:
 
     _instance: InjectQ | None = None
 
+    __slots__ = (
+        "__weakref__",
+        "_allow_override",
+        "_bindings_version",
+        "_factories",
+        "_get_binding",
+        "_lock",
+        "_registry",
+        "_resolve",
+        "_resolver",
+        "_scope_manager",
+        "_singleton_cache",
+        "_thread_safe",
+    )
+
     def __init__(
         self,
         modules: list[Any] | None = None,
@@ -93,7 +176,6 @@ class InjectQ:
         )
         self._allow_override = allow_override
         self._registry = ServiceRegistry()
-        self._resolver = DependencyResolver(self._registry)
 
         # Choose scope manager based on async support requirement
         if use_async_scopes:
@@ -103,11 +185,22 @@ class InjectQ:
         else:
             self._scope_manager = ScopeManager()
 
-        self._resolver.scope_manager = self._scope_manager
+        self._resolver = DependencyResolver(self._registry, self._scope_manager)
         self._factories = FactoryProxy(self)
 
+        # Bound lookups for the get() hot path
+        self._resolve = self._resolver.resolve
+        self._get_binding = self._registry.get_binding
+
+        # Singleton-bound services already resolved through get(), dropped
+        # whenever bindings or cached scope instances change
+        self._singleton_cache: dict[ServiceKey, Any] = {}
+        # Bumped on every binding or scope change
+        self._bindings_version = 0
+
         # Thread safety support
         self._thread_safe = thread_safe
+        self._lock: HybridLock | None
         if thread_safe:
             self._lock = HybridLock()
         else:
@@ -115,8 +208,7 @@ class InjectQ:
 
         # Install modules if provided
         if modules:
-            for module in modules:
-                self.install_module(module)
+            self._install_modules(modules)
 
     @classmethod
     def get_instance(cls) -> InjectQ:
@@ -131,15 +223,14 @@ class InjectQ:
             InjectQ: The current container instance, either from the context
             or as a singleton.
         """
-        from .context import ContainerContext
-
         ctx = ContainerContext.get_current()
         if ctx is not None:
             return ctx
 
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        instance = cls._instance
+        if instance is None:
+            instance = cls._instance = cls()
+        return instance
 
     @classmethod
     def reset_instance(cls) -> None:
@@ -154,38 +245,60 @@ class InjectQ:
         else:
             return operation()
 
+    def _change_bindings(self, operation: Callable) -> Any:
+        """Run a binding or scope change and drop the memoized singletons."""
+
+        def change() -> Any:
+            try:
+                return operation()
+            finally:
+                self._singleton_cache.clear()
+                self._bindings_version += 1
+
+        return self._ensure_thread_safe(change)
+
     # Dict-like interface
     def __setitem__(self, service_type: ServiceKey, implementation: Any) -> None:
         """Bind a service type to an implementation using dict syntax."""
+        self._change_bindings(lambda: self._register_item(service_type, implementation))
+
+    def _register_item(self, service_type: ServiceKey, implementation: Any) -> None:
+        """Write a ``container[key] = value`` binding straight to the registry."""
         # Auto-detect if None should be allowed based on implementation value
         allow_none = implementation is None
 
         # If implementation is a class type, use bind() for proper validation
         # If implementation is an instance, use bind_instance()
         if isinstance(implementation, type):
-            self._ensure_thread_safe(
-                lambda: self.bind(
-                    service_type,
-                    implementation,
-                    scope=ScopeType.SINGLETON,
-                    allow_none=allow_none,
-                    allow_concrete=True,
-                )
+            _logger.debug(
+                "Binding service: %s -> %s (scope: %s)",
+                service_type,
+                implementation,
+                ScopeType.SINGLETON.value,
+            )
+            self._registry.bind(
+                service_type,
+                implementation,
+                ScopeType.SINGLETON,
+                allow_none=allow_none,
+                allow_concrete=True,
+                allow_override=self._allow_override,
             )
         else:
-            self._ensure_thread_safe(
-                lambda: self.bind_instance(
-                    service_type,
-                    implementation,
-                    allow_none,
-                    allow_concrete=True,
-                )
+            _logger.debug(
+                "Binding instance: %s (%s)", service_type, type(implementation).__name__
+            )
+            self._registry.bind_instance(
+                service_type,
+                implementation,
+                allow_none,
+                allow_concrete=True,
+                allow_override=self._allow_override,
             )
 
     def __getitem__(self, service_type: ServiceKey) -> Any:
         """Get a service instance using dict syntax."""
-        _logger.debug("Getting service via __getitem__: %s", service_type)
-        return self._ensure_thread_safe(lambda: self.get(service_type))
+        return self.get(service_type)
 
     def __delitem__(self, service_type: ServiceKey) -> None:
         """Remove a service binding using dict syntax."""
@@ -196,12 +309,12 @@ class InjectQ:
                 msg = f"No binding registered for {service_type}"
                 raise KeyError(msg)
 
-        self._ensure_thread_safe(remove_binding)
+        self._change_bindings(remove_binding)
 
     def __contains__(self, service_type: ServiceKey) -> bool:
         """Check if a service is registered."""
-        _logger.debug("Checking if service registered: %s", service_type)
-        return self._ensure_thread_safe(lambda: service_type in self._registry)
+        # A single dict probe is atomic, so no lock is needed
+        return service_type in self._registry
 
     def bind(
         self,
@@ -223,14 +336,14 @@ class InjectQ:
             allow_concrete: Whether to auto-register concrete types when
                           registering instances (default: True)
         """
-        scope_str = scope.value if isinstance(scope, ScopeType) else scope
+        scope_str = scope.value if type(scope) is ScopeType else scope
         _logger.debug(
             "Binding service: %s -> %s (scope: %s)",
             service_type,
             implementation if implementation is not _UNSET else "self",
             scope_str,
         )
-        self._ensure_thread_safe(
+        self._change_bindings(
             lambda: self._registry.bind(
                 service_type,
                 implementation,
@@ -258,9 +371,10 @@ class InjectQ:
             allow_concrete: Whether to auto-register concrete types when
                           registering instances (default: True)
         """
-        instance_type = type(instance).__name__ if instance else "None"
-        _logger.debug("Binding instance: %s (%s)", service_type, instance_type)
-        self._ensure_thread_safe(
+        _logger.debug(
+            "Binding instance: %s (%s)", service_type, type(instance).__name__
+        )
+        self._change_bindings(
             lambda: self._registry.bind_instance(
                 service_type,
                 instance,
@@ -287,7 +401,7 @@ class InjectQ:
             factory.__name__ if hasattr(factory, "__name__") else str(factory)
         )
         _logger.debug("Binding factory: %s -> %s", service_type, factory_name)
-        self._ensure_thread_safe(
+        self._change_bindings(
             lambda: self._registry.bind_factory(
                 service_type,
                 factory,
@@ -295,6 +409,30 @@ class InjectQ:
             )
         )
 
+    @contextmanager
+    def batch_bind(self) -> Iterator[dict[ServiceKey, Any]]:
+        """Collect several bindings and apply them as a single change.
+
+        Bindings are staged in the yielded dict and applied on exit with the
+        same semantics as ``container[key] = value``. Nothing is bound if
+        the block raises.
+
+        Example:
+            with container.batch_bind() as bindings:
+                bindings["agent_name"] = name
+                bindings[Agent] = agent
+        """
+        staged: dict[ServiceKey, Any] = {}
+        yield staged
+
+        def apply() -> None:
+            for service_type, implementation in staged.items():
+                self._register_item(service_type, implementation)
+
+        _logger.debug("Applying %d batched bindings", len(staged))
+        # One invalidation of the memoized singletons for the whole batch
+        self._change_bindings(apply)
+
     @property
     def factories(self) -> FactoryProxy:
         """Get the factory proxy for dict-like factory bindings."""
@@ -303,15 +441,38 @@ class InjectQ:
     # Resolution methods
     def get(self, service_type: ServiceKey) -> Any:
         """Get a service instance."""
-        _logger.debug("Resolving service: %s", service_type)
-        return self._ensure_thread_safe(lambda: self._resolver.resolve(service_type))
+        instance = self._singleton_cache.get(service_type, _MISSING)
+        if instance is not _MISSING:
+            return instance
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Resolving service: %s", service_type)
+        # Hot path: avoid the closure allocation of _ensure_thread_safe
+        lock = self._lock
+        if lock is None:
+            return self._resolve_and_cache(service_type)
+        with lock:
+            return self._resolve_and_cache(service_type)
+
+    def _resolve_and_cache(self, service_type: ServiceKey) -> Any:
+        """Resolve a service, memoizing it if it is bound as a singleton."""
+        instance = self._resolve(service_type)
+        # A key holds a binding or a factory, never both, so a singleton
+        # binding here means no factory can shadow it
+        binding = self._get_binding(service_type)
+        if binding is not None and binding.scope == ScopeType.SINGLETON.value:
+            self._singleton_cache[service_type] = instance
+        return instance
 
     async def aget(self, service_type: ServiceKey) -> Any:
         """Get a service instance asynchronously."""
-        _logger.debug("Resolving service async: %s", service_type)
-        return await self._ensure_thread_safe(
-            lambda: self._resolver.resolve_async(service_type)
-        )
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Resolving service async: %s", service_type)
+        lock = self._lock
+        if lock is None:
+            return await self._resolver.resolve_async(service_type)
+        with lock:
+            coro = self._resolver.resolve_async(service_type)
+        return await coro
 
     async def atry_get(self, service_type: ServiceKey, default: Any = None) -> Any:
         """Try to get a service instance, returning default if not found."""
@@ -337,7 +498,7 @@ class InjectQ:
 
     def has(self, service_type: ServiceKey) -> bool:
         """Check if a service type can be resolved."""
-        return self._ensure_thread_safe(lambda: service_type in self._registry)
+        return service_type in self._registry
 
     def get_factory(self, service_type: ServiceKey) -> ServiceFactory:
         """Get the raw factory function without invoking it.
@@ -480,26 +641,18 @@ class InjectQ:
             >>> # Provide user_id, db will be injected automatically
             >>> service = injector.invoke("service", user_id="123")
         """
-        import inspect
-
         factory = self.get_factory(service_type)
-        sig = inspect.signature(factory)
 
         # Build complete kwargs dict with DI for missing params
         complete_kwargs = dict(kwargs)
-
-        # Track which params are already provided by positional args
-        param_list = list(sig.parameters.keys())
-        provided_by_position = set(param_list[: len(args)])
-
-        # Primitive types that we shouldn't auto-inject by type
-        # (to avoid ambiguous injections like int, str, bool)
-        primitive_types = (str, int, float, bool, bytes, type(None))
+        provided_by_position = len(args)
 
         # Inject missing dependencies
-        for param_name, param in sig.parameters.items():
+        for index, (param_name, annotation, by_type, required) in enumerate(
+            _get_invoke_plan(factory)
+        ):
             # Skip if already provided via args or kwargs
-            if param_name in provided_by_position or param_name in complete_kwargs:
+            if index < provided_by_position or param_name in complete_kwargs:
                 continue
 
             # Try to inject this parameter
@@ -510,24 +663,15 @@ class InjectQ:
                     complete_kwargs[param_name] = self.get(param_name)
                     injected = True
                 # Then try by type annotation (but not for primitive types)
-                elif (
-                    param.annotation != inspect.Parameter.empty
-                    and param.annotation not in primitive_types
-                ):
-                    if self.has(param.annotation):
-                        complete_kwargs[param_name] = self.get(param.annotation)
-                        injected = True
+                elif by_type and self.has(annotation):
+                    complete_kwargs[param_name] = self.get(annotation)
+                    injected = True
             except DependencyNotFoundError:
                 pass
 
             # If not injected and required, raise error
-            if (
-                not injected
-                and param.default == inspect.Parameter.empty
-                and param.kind
-                not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
-            ):
-                raise DependencyNotFoundError(param.annotation)  # type: ignore  # noqa: PGH003
+            if not injected and required:
+                raise DependencyNotFoundError(annotation)  # type: ignore  # noqa: PGH003
 
         # Call the factory with positional args and complete kwargs
         return factory(*args, **complete_kwargs)
@@ -567,25 +711,19 @@ class InjectQ:
             >>> service = await injector.ainvoke("service", user_id="123")
         """
         import asyncio
-        import inspect
 
         factory = await self.aget_factory(service_type)
-        sig = inspect.signature(factory)
 
         # Build complete kwargs dict with DI for missing params
         complete_kwargs = dict(kwargs)
-
-        # Track which params are already provided by positional args
-        param_list = list(sig.parameters.keys())
-        provided_by_position = set(param_list[: len(args)])
-
-        # Primitive types that we shouldn't auto-inject by type
-        primitive_types = (str, int, float, bool, bytes, type(None))
+        provided_by_position = len(args)
 
         # Inject missing dependencies
-        for param_name, param in sig.parameters.items():
+        for index, (param_name, annotation, by_type, required) in enumerate(
+            _get_invoke_plan(factory)
+        ):
             # Skip if already provided via args or kwargs
-            if param_name in provided_by_position or param_name in complete_kwargs:
+            if index < provided_by_position or param_name in complete_kwargs:
                 continue
 
             # Try to inject this parameter
@@ -596,24 +734,15 @@ class InjectQ:
                     complete_kwargs[param_name] = await self.aget(param_name)
                     injected = True
                 # Then try by type annotation (but not for primitive types)
-                elif (
-                    param.annotation != inspect.Parameter.empty
-                    and param.annotation not in primitive_types
-                ):
-                    if self.has(param.annotation):
-                        complete_kwargs[param_name] = await self.aget(param.annotation)
-                        injected = True
+                elif by_type and self.has(annotation):
+                    complete_kwargs[param_name] = await self.aget(annotation)
+                    injected = True
             except DependencyNotFoundError:
                 pass
 
             # If not injected and required, raise error
-            if (
-                not injected
-                and param.default == inspect.Parameter.empty
-                and param.kind
-                not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
-            ):
-                raise DependencyNotFoundError(param.annotation)  # type: ignore  # noqa: PGH003
+            if not injected and required:
+                raise DependencyNotFoundError(annotation)  # type: ignore  # noqa: PGH003
 
         # Call the factory with positional args and complete kwargs
         if asyncio.iscoroutinefunction(factory):
@@ -623,14 +752,10 @@ class InjectQ:
     # Scope management
     def scope(self, scope_name: str | ScopeType) -> Any:
         """Enter a scope context."""
-        if isinstance(scope_name, ScopeType):
-            scope_name = scope_name.value
         return self._scope_manager.scope_context(scope_name)
 
     def async_scope(self, scope_name: str | ScopeType) -> Any:
         """Enter an async scope context."""
-        if isinstance(scope_name, ScopeType):
-            scope_name = scope_name.value
         # Check if scope manager supports async contexts
         if hasattr(self._scope_manager, "async_scope_context"):
             return self._scope_manager.async_scope_context(scope_name)  # type: ignore  # noqa: PGH003
@@ -639,13 +764,11 @@ class InjectQ:
 
     def clear_scope(self, scope_name: str | ScopeType) -> None:
         """Clear all instances in a scope."""
-        if isinstance(scope_name, ScopeType):
-            scope_name = scope_name.value
-        self._ensure_thread_safe(lambda: self._scope_manager.clear_scope(scope_name))
+        self._change_bindings(lambda: self._scope_manager.clear_scope(scope_name))
 
     def clear_all_scopes(self) -> None:
         """Clear all instances in all scopes."""
-        self._ensure_thread_safe(lambda: self._scope_manager.clear_all_scopes())
+        self._change_bindings(lambda: self._scope_manager.clear_all_scopes())
 
     # Context management for multi-container support
     @contextmanager
@@ -660,43 +783,41 @@ class InjectQ:
                 # Dependencies resolved using this container
                 my_function()
         """
-        from .context import ContainerContext
-
-        old_container = ContainerContext.get_current()
-        ContainerContext.set_current(self)
-        try:
+        with ContainerContext.use(self):
             yield
-        finally:
-            if old_container is not None:
-                ContainerContext.set_current(old_container)
-            else:
-                ContainerContext.clear_current()
 
     def activate(self) -> None:
         """Activate this container as the current default context.
 
         This sets the container as the active context for all subsequent
         dependency resolution calls that don't specify a container explicitly.
+        The active container is held in a ``ContextVar``, so activation only
+        applies to the calling thread or asyncio task and to tasks it starts
+        afterwards; activating inside a task does not change the thread's
+        container.
 
         Note: Use context() manager for temporary activation instead.
         """
-        from .context import ContainerContext
-
         ContainerContext.set_current(self)
 
     # Module installation
     def install_module(self, module: Any) -> None:
         """Install a module into the container."""
+        self._install_modules((module,))
+
+    def _install_modules(self, modules: Iterable[Any]) -> None:
+        """Configure modules in order, sharing one binder under one lock."""
 
         def install() -> None:
-            module_name = getattr(module, "__name__", str(module))
-            _logger.info("Installing module: %s", module_name)
-            if hasattr(module, "configure"):
-                binder = ModuleBinder(self)
-                module.configure(binder)
-            else:
-                msg = f"Module {module} does not have a configure method"
-                raise BindingError(msg)
+            binder = ModuleBinder(self)
+            for module in modules:
+                module_name = getattr(module, "__name__", str(module))
+                _logger.info("Installing module: %s", module_name)
+                configure = getattr(module, "configure", None)
+                if configure is None:
+                    msg = f"Module {module} does not have a configure method"
+                    raise BindingError(msg)
+                configure(binder)
 
         self._ensure_thread_safe(install)
 
@@ -738,7 +859,7 @@ class InjectQ:
             self._registry.clear()
             self.clear_all_scopes()
 
-        self._ensure_thread_safe(clear)
+        self._change_bindings(clear)
 
     def __repr__(self) -> str:
         """String representation of the container."""
@@ -757,34 +878,51 @@ class InjectQ:
             original_factory = self._registry.get_factory(service_type)
             return original_binding, original_factory
 
+        def park_singletons() -> dict[Any, Any] | None:
+            # Dependents of the overridden service must be rebuilt, so start
+            # from an empty singleton scope but keep the old instances aside
+            singletons = self._scope_manager.get_scope("singleton")
+            if isinstance(singletons, SingletonScope):
+                return singletons.swap_instances({})
+            singletons.clear()
+            return None
+
         def restore_override(
             original_binding: Any,
             original_factory: Any,
+            parked: dict[Any, Any] | None,
+            version: int | None,
         ) -> None:
-            # Clear cached instances again before restoring
-            self._scope_manager.clear_scope("singleton")
+            # Instances built during the override may hold the override value.
+            # Put back the parked ones unless bindings changed in the meantime,
+            # in which case they may be stale and everything is rebuilt instead
+            singletons = self._scope_manager.get_scope("singleton")
+            if parked is not None and version == self._bindings_version:
+                singletons.swap_instances(parked)  # type: ignore[attr-defined]
+            else:
+                singletons.clear()
             # Restore original binding
             self._registry.remove_binding(service_type)
             if original_factory:
                 self._registry.bind_factory(service_type, original_factory)
             elif original_binding:
-                self._registry._bindings[service_type] = original_binding  # noqa: SLF001
+                self._registry.restore_binding(original_binding)
 
         original_binding, original_factory = self._ensure_thread_safe(setup_override)
 
+        parked = None
+        version = None
         try:
-            # Clear any cached instances for this service type
-            self._ensure_thread_safe(
-                lambda: self._scope_manager.clear_scope("singleton")
-            )
+            parked = self._change_bindings(park_singletons)
             # Set override
-            self._ensure_thread_safe(
-                lambda: self.bind_instance(service_type, override_value)
-            )
+            self.bind_instance(service_type, override_value)
+            version = self._bindings_version
             yield
         finally:
-            self._ensure_thread_safe(
-                lambda: restore_override(original_binding, original_factory)
+            self._change_bindings(
+                lambda: restore_override(
+                    original_binding, original_factory, parked, version
+                )
             )
 
     @classmethod
@@ -804,6 +942,8 @@ class InjectQ:
 class ModuleBinder:
     """Binder interface for modules to configure the container."""
 
+    __slots__ = ("_container",)
+
     def __init__(self, container: InjectQ) -> None:
         self._container = container
 
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import contextvars
 import logging
-import threading
 from contextlib import asynccontextmanager, contextmanager
 from typing import TYPE_CHECKING
 
@@ -23,9 +22,12 @@ class ContainerContext:
 
     Provides thread-local and async task-local context isolation
     to allow multiple containers to coexist without interference.
+    A ``ContextVar`` covers both: each thread and each asyncio task
+    sees its own value.
     """
 
-    _thread_local = threading.local()
+    __slots__ = ()
+
     _context_var: contextvars.ContextVar[InjectQ | None] = contextvars.ContextVar(
         "container_context", default=None
     )
@@ -34,47 +36,41 @@ class ContainerContext:
     def get_current(cls) -> InjectQ | None:
         """Get the current active container.
 
-        First tries async context variable, then falls back to thread-local storage.
-
         Returns:
             The current active container or None if no container is active.
         """
-        # Try async context first
-        try:
-            container = cls._context_var.get()
-            if container is not None:
-                _logger.debug("Found container in async context")
-                return container
-        except LookupError:
-            pass
-
-        # Fall back to thread-local storage
-        container = getattr(cls._thread_local, "container", None)
-        if container is not None:
-            _logger.debug("Found container in thread-local storage")
-        return container
+        return cls._context_var.get()
 
     @classmethod
-    def set_current(cls, container: InjectQ) -> None:
+    def set_current(cls, container: InjectQ) -> contextvars.Token[InjectQ | None]:
         """Set the current active container.
 
-        Sets in both async context variable and thread-local storage
-        to ensure compatibility with both sync and async contexts.
-
         Args:
             container: The container to set as current.
+
+        Returns:
+            A token that restores the previous container when passed to
+            ``ContextVar.reset``.
         """
-        _logger.debug("Setting current container in context")
-        cls._context_var.set(container)
-        cls._thread_local.container = container
+        return cls._context_var.set(container)
 
     @classmethod
     def clear_current(cls) -> None:
         """Clear the current active container."""
-        _logger.debug("Clearing current container from context")
         cls._context_var.set(None)
-        if hasattr(cls._thread_local, "container"):
-            delattr(cls._thread_local, "container")
+
+    @classmethod
+    def _restore(
+        cls, token: contextvars.Token[InjectQ | None], previous: InjectQ | None
+    ) -> None:
+        """Restore the container that was active before ``token`` was set."""
+        try:
+            cls._context_var.reset(token)
+        except ValueError:
+            # The context was exited from a different context than it was
+            # entered in (e.g. a generator finalized by another task), where
+            # the token is not valid; set the old value there instead
+            cls._context_var.set(previous)
 
     @classmethod
     @contextmanager
@@ -88,16 +84,12 @@ class ContainerContext:
             None
         """
         _logger.debug("Entering container context")
-        old_container = cls.get_current()
-        cls.set_current(container)
+        previous = cls._context_var.get()
+        token = cls._context_var.set(container)
         try:
             yield
         finally:
-            _logger.debug("Exiting container context")
-            if old_container is not None:
-                cls.set_current(old_container)
-            else:
-                cls.clear_current()
+            cls._restore(token, previous)
 
     @classmethod
     @asynccontextmanager
@@ -111,13 +103,9 @@ class ContainerContext:
             None
         """
         _logger.debug("Entering async container context")
-        old_container = cls.get_current()
-        cls.set_current(container)
+        previous = cls._context_var.get()
+        token = cls._context_var.set(container)
         try:
             yield
         finally:
-            _logger.debug("Exiting async container context")
-            if old_container is not None:
-                cls.set_current(old_container)
-            else:
-                cls.clear_current()
+            cls._restore(token, previous)
@@ -1,8 +1,10 @@
 """Service registry for InjectQ dependency injection library."""
 
-import inspect
 import logging
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
 from injectq.utils import (
@@ -20,8 +22,25 @@ _UNSET = object()
 
 _logger = logging.getLogger("injectq.core")
 
+# Tags for ServiceRegistry entries; a key holds either a binding or a factory
+_BINDING = 0
+_FACTORY = 1
 
-@dataclass
+
+def _is_abstract(cls: type) -> bool:
+    """Check whether a class still has unimplemented abstract methods."""
+    # ABCMeta keeps this frozenset on the class, so no MRO walk is needed
+    return bool(getattr(cls, "__abstractmethods__", None))
+
+
+def _intern_key(service_type: ServiceKey) -> ServiceKey:
+    """Intern string keys so later dict probes can match by identity."""
+    if isinstance(service_type, str):
+        return sys.intern(service_type)
+    return service_type
+
+
+@dataclass(slots=True)
 class ServiceBinding:
     """Represents a service binding configuration."""
 
@@ -42,8 +61,25 @@ class ServiceRegistry:
     """Registry for managing service bindings and their configurations."""
 
     def __init__(self) -> None:
-        self._bindings: dict[ServiceKey, ServiceBinding] = {}
-        self._factories: dict[ServiceKey, ServiceFactory] = {}
+        self._entries: dict[ServiceKey, tuple[int, Any]] = {}
+        # Read-only (bindings, factories) snapshots, rebuilt after a change
+        self._views: (
+            tuple[
+                MappingProxyType[ServiceKey, ServiceBinding],
+                MappingProxyType[ServiceKey, ServiceFactory],
+            ]
+            | None
+        ) = None
+
+    def _put(self, service_type: ServiceKey, entry: tuple[int, Any]) -> None:
+        """Store an entry and drop the cached views."""
+        self._entries[service_type] = entry
+        self._views = None
+
+    def _drop(self, service_type: ServiceKey) -> None:
+        """Remove an entry and drop the cached views."""
+        del self._entries[service_type]
+        self._views = None
 
     def bind(
         self,
@@ -68,6 +104,8 @@ class ServiceRegistry:
             allow_override: Whether to allow overriding existing registrations
                           (default: True)
         """
+        service_type = _intern_key(service_type)
+
         # Handle alternative parameter naming
         if to is not None:
             implementation = to
@@ -88,24 +126,25 @@ class ServiceRegistry:
             msg = f"Implementation cannot be None for {service_type}"
             raise BindingError(msg)
 
+        # Instances (the common re-bind case) skip all class-only checks
+        is_class = isinstance(implementation, type)
+
         # Check if implementation is an abstract class
-        if (
-            implementation is not None
-            and isinstance(implementation, type)
-            and inspect.isabstract(implementation)
-        ):
+        if is_class and _is_abstract(implementation):
             msg = f"Cannot bind abstract class {implementation}"
             raise BindingError(msg)
 
         # Check for existing binding if override not allowed
-        if not allow_override and service_type in self._bindings:
+        if not allow_override and service_type in self._entries:
             _logger.debug(
                 "Binding already exists, override not allowed: %s", service_type
             )
             raise AlreadyRegisteredError(service_type)
 
         # Normalize scope
-        scope_name = scope.value if isinstance(scope, ScopeType) else str(scope)
+        scope_name = sys.intern(
+            scope.value if isinstance(scope, ScopeType) else str(scope)
+        )
         _logger.debug(
             "Creating binding: %s -> %s (scope: %s)",
             service_type,
@@ -121,17 +160,17 @@ class ServiceRegistry:
             allow_none=allow_none,
         )
 
-        self._bindings[service_type] = binding
+        self._put(service_type, (_BINDING, binding))
         # Auto-register concrete type if requested and implementation is an instance
         if (
             allow_concrete
+            and not is_class
             and implementation is not None
-            and not isinstance(implementation, type)
             and type(implementation) is not service_type
         ):
             concrete_type = type(implementation)
             # Check for existing concrete binding if override not allowed
-            if not allow_override and concrete_type in self._bindings:
+            if not allow_override and concrete_type in self._entries:
                 raise AlreadyRegisteredError(concrete_type)
 
             # Create concrete binding
@@ -141,7 +180,7 @@ class ServiceRegistry:
                 scope=scope_name,
                 allow_none=allow_none,
             )
-            self._bindings[concrete_type] = concrete_binding
+            self._put(concrete_type, (_BINDING, concrete_binding))
 
     def bind_factory(
         self,
@@ -161,11 +200,13 @@ class ServiceRegistry:
             msg = f"Factory must be callable for {service_type}"
             raise BindingError(msg)
 
-        # Check for existing factory if override not allowed
-        if not allow_override and service_type in self._factories:
+        service_type = _intern_key(service_type)
+
+        # Check for existing registration if override not allowed
+        if not allow_override and service_type in self._entries:
             raise AlreadyRegisteredError(service_type)
 
-        self._factories[service_type] = factory
+        self._put(service_type, (_FACTORY, factory))
 
     def bind_instance(
         self,
@@ -191,8 +232,10 @@ class ServiceRegistry:
             msg = f"Cannot bind instance of {type(instance)} to {service_type}"
             raise BindingError(msg)
 
+        service_type = _intern_key(service_type)
+
         # Check for existing binding if override not allowed
-        if not allow_override and service_type in self._bindings:
+        if not allow_override and service_type in self._entries:
             raise AlreadyRegisteredError(service_type)
 
         binding = ServiceBinding(
@@ -201,7 +244,7 @@ class ServiceRegistry:
             scope=ScopeType.SINGLETON.value,
             allow_none=allow_none,
         )
-        self._bindings[service_type] = binding
+        self._put(service_type, (_BINDING, binding))
 
         # Auto-register concrete type if requested and instance is not None
         if (
@@ -212,7 +255,7 @@ class ServiceRegistry:
         ):
             concrete_type = type(instance)
             # Check for existing concrete binding if override not allowed
-            if not allow_override and concrete_type in self._bindings:
+            if not allow_override and concrete_type in self._entries:
                 raise AlreadyRegisteredError(concrete_type)
 
             # Create concrete binding
@@ -222,54 +265,97 @@ class ServiceRegistry:
                 scope=ScopeType.SINGLETON.value,
                 allow_none=allow_none,
             )
-            self._bindings[concrete_type] = concrete_binding
+            self._put(concrete_type, (_BINDING, concrete_binding))
 
     def get_binding(self, service_type: ServiceKey) -> ServiceBinding | None:
         """Get the binding for a service type."""
-        return self._bindings.get(service_type)
+        entry = self._entries.get(service_type)
+        if entry is not None and entry[0] == _BINDING:
+            return entry[1]
+        return None
+
+    def get_entry(self, service_type: ServiceKey) -> tuple[int, Any] | None:
+        """Get the tagged ``(kind, binding or factory)`` entry for a service type."""
+        return self._entries.get(service_type)
 
     def get_factory(self, service_type: ServiceKey) -> ServiceFactory | None:
         """Get the factory for a service type."""
-        return self._factories.get(service_type)
+        entry = self._entries.get(service_type)
+        if entry is not None and entry[0] == _FACTORY:
+            return entry[1]
+        return None
 
     def has_binding(self, service_type: ServiceKey) -> bool:
         """Check if a service type has a binding."""
-        return service_type in self._bindings
+        entry = self._entries.get(service_type)
+        return entry is not None and entry[0] == _BINDING
 
     def has_factory(self, service_type: ServiceKey) -> bool:
         """Check if a service type has a factory."""
-        return service_type in self._factories
+        entry = self._entries.get(service_type)
+        return entry is not None and entry[0] == _FACTORY
 
     def remove_binding(self, service_type: ServiceKey) -> bool:
         """Remove a service binding."""
-        if service_type in self._bindings:
-            del self._bindings[service_type]
+        if self.has_binding(service_type):
+            self._drop(service_type)
             return True
         return False
 
     def remove_factory(self, service_type: ServiceKey) -> bool:
         """Remove a service factory."""
-        if service_type in self._factories:
-            del self._factories[service_type]
+        if self.has_factory(service_type):
+            self._drop(service_type)
             return True
         return False
 
+    def restore_binding(self, binding: ServiceBinding) -> None:
+        """Put back a binding previously returned by ``get_binding``."""
+        self._put(binding.service_type, (_BINDING, binding))
+
     def clear(self) -> None:
         """Clear all bindings and factories."""
-        self._bindings.clear()
-        self._factories.clear()
+        self._entries.clear()
+        self._views = None
+
+    def _get_views(
+        self,
+    ) -> tuple[
+        MappingProxyType[ServiceKey, ServiceBinding],
+        MappingProxyType[ServiceKey, ServiceFactory],
+    ]:
+        """Build the bindings/factories views once per registry change."""
+        views = self._views
+        if views is None:
+            bindings: dict[ServiceKey, ServiceBinding] = {}
+            factories: dict[ServiceKey, ServiceFactory] = {}
+            for key, (tag, value) in self._entries.items():
+                (factories if tag == _FACTORY else bindings)[key] = value
+            views = self._views = (
+                MappingProxyType(bindings),
+                MappingProxyType(factories),
+            )
+        return views
+
+    def get_all_bindings(self) -> Mapping[ServiceKey, ServiceBinding]:
+        """Get all service bindings.
 
-    def get_all_bindings(self) -> dict[ServiceKey, ServiceBinding]:
-        """Get all service bindings."""
-        return self._bindings.copy()
+        The result is a read-only snapshot shared between callers until the
+        registry next changes, so it is safe to iterate while binding.
+        """
+        return self._get_views()[0]
 
-    def get_all_factories(self) -> dict[ServiceKey, ServiceFactory]:
-        """Get all service factories."""
-        return self._factories.copy()
+    def get_all_factories(self) -> Mapping[ServiceKey, ServiceFactory]:
+        """Get all service factories.
+
+        The result is a read-only snapshot shared between callers until the
+        registry next changes, so it is safe to iterate while binding.
+        """
+        return self._get_views()[1]
 
     def validate(self) -> None:
         """Validate all bindings for consistency."""
-        for service_type, binding in self._bindings.items():
+        for service_type, binding in self.get_all_bindings().items():
             try:
                 # Validate that implementation is reasonable
                 if binding.implementation is None:
@@ -298,15 +384,16 @@ class ServiceRegistry:
 
     def __contains__(self, service_type: ServiceKey) -> bool:
         """Check if service type is registered."""
-        return self.has_binding(service_type) or self.has_factory(service_type)
+        return service_type in self._entries
 
     def __len__(self) -> int:
         """Get total number of registered services."""
-        return len(self._bindings) + len(self._factories)
+        return len(self._entries)
 
     def __repr__(self) -> str:
         """String representation of registry."""
+        factories = len(self.get_all_factories())
         return (
-            f"ServiceRegistry(bindings={len(self._bindings)}, "
-            f"factories={len(self._factories)})"
+            f"ServiceRegistry(bindings={len(self._entries) - factories}, "
+            f"factories={factories})"
         )
@@ -14,11 +14,12 @@ from injectq.utils import (
     format_type_name,
     get_class_constructor_dependencies,
     get_function_dependencies,
+    get_signature,
     is_injectable_class,
 )
 
 from .base_scope_manager import BaseScopeManager
-from .registry import ServiceBinding, ServiceRegistry
+from .registry import _FACTORY, ServiceBinding, ServiceRegistry
 from .scopes import get_scope_manager
 
 
@@ -59,7 +60,8 @@ class DependencyResolver:
             raise CircularDependencyError(cycle)  # type: ignore  # noqa: PGH003
 
         try:
-            _logger.debug("Resolving service: %s", service_type)
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug("Resolving service: %s", service_type)
             self._resolution_stack.append(service_type)
             return self._do_resolve(service_type)
         finally:
@@ -87,7 +89,8 @@ class DependencyResolver:
             raise CircularDependencyError(cycle)  # type: ignore  # noqa: PGH003
 
         try:
-            _logger.debug("Resolving service (async): %s", service_type)
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug("Resolving service (async): %s", service_type)
             self._resolution_stack.append(service_type)
             return await self._do_resolve_async(service_type)
         finally:
@@ -95,15 +98,13 @@ class DependencyResolver:
 
     def _do_resolve(self, service_type: ServiceKey) -> Any:
         """Internal method to perform the actual resolution."""
-        # Check if it's a factory binding
-        factory = self.registry.get_factory(service_type)
-        if factory is not None:
-            return self._resolve_factory(service_type, factory)
-
-        # Check if it's a regular binding
-        binding = self.registry.get_binding(service_type)
-        if binding is not None:
-            return self._resolve_binding(binding)
+        # One probe tells a factory from a regular binding
+        entry = self.registry.get_entry(service_type)
+        if entry is not None:
+            kind, target = entry
+            if kind == _FACTORY:
+                return self._resolve_factory(service_type, target)
+            return self._resolve_binding(target)
 
         # Try to auto-bind if it's a concrete class
         if isinstance(service_type, type) and is_injectable_class(service_type):
@@ -114,15 +115,13 @@ class DependencyResolver:
 
     async def _do_resolve_async(self, service_type: ServiceKey) -> Any:
         """Internal method to perform the actual async resolution."""
-        # Check if it's a factory binding
-        factory = self.registry.get_factory(service_type)
-        if factory is not None:
-            return await self._resolve_factory_async(service_type, factory)
-
-        # Check if it's a regular binding
-        binding = self.registry.get_binding(service_type)
-        if binding is not None:
-            return await self._resolve_binding_async(binding)
+        # One probe tells a factory from a regular binding
+        entry = self.registry.get_entry(service_type)
+        if entry is not None:
+            kind, target = entry
+            if kind == _FACTORY:
+                return await self._resolve_factory_async(service_type, target)
+            return await self._resolve_binding_async(target)
 
         # Try to auto-bind if it's a concrete class
         if isinstance(service_type, type) and is_injectable_class(service_type):
@@ -143,6 +142,11 @@ class DependencyResolver:
             )
             raise InjectionError(msg)
 
+        # Instance bindings resolve to the bound object in every scope, so
+        # skip the scope lookup (this also keeps re-bound instances fresh)
+        if not isinstance(binding.implementation, type):
+            return binding.implementation
+
         def factory() -> Any:
             return self._create_instance(binding.implementation)
 
@@ -220,16 +224,8 @@ class DependencyResolver:
         if not isinstance(implementation, type):
             return implementation
 
-        # If it's a class, create an instance with dependency injection
-        if inspect.isclass(implementation):
-            return self._instantiate_class(implementation)
-
-        # If it's callable, invoke it
-        if callable(implementation):
-            return self._invoke_factory(implementation)
-
-        msg = f"Don't know how to create instance from: {implementation}"
-        raise InjectionError(msg)
+        # Otherwise it's a class, create an instance with dependency injection
+        return self._instantiate_class(implementation)
 
     async def _create_instance_async(self, implementation: Any) -> Any:
         """Create an instance from an implementation asynchronously."""
@@ -237,18 +233,8 @@ class DependencyResolver:
         if not isinstance(implementation, type):
             return implementation
 
-        # If it's a class, create an instance with dependency injection
-        if inspect.isclass(implementation):
-            return await self._instantiate_class_async(implementation)
-
-        # If it's callable, invoke it
-        if callable(implementation):
-            if asyncio.iscoroutinefunction(implementation):
-                return await self._invoke_factory_async(implementation)
-            return self._invoke_factory(implementation)
-
-        msg = f"Don't know how to create instance from: {implementation}"
-        raise InjectionError(msg)
+        # Otherwise it's a class, create an instance with dependency injection
+        return await self._instantiate_class_async(implementation)
 
     def _instantiate_class(self, cls: type[Any]) -> Any:
         """Instantiate a class with dependency injection."""
@@ -261,16 +247,14 @@ class DependencyResolver:
             for param_name, param_type in dependencies.items():
                 try:
                     # First try to resolve by parameter name (string key)
-                    if self.registry.has_binding(
-                        param_name
-                    ) or self.registry.has_factory(param_name):
+                    if param_name in self.registry:
                         resolved_args[param_name] = self.resolve(param_name)
                     else:
                         # Fall back to type-based resolution
                         resolved_args[param_name] = self.resolve(param_type)
                 except DependencyNotFoundError:  # noqa: PERF203
                     # Check if parameter has a default value
-                    sig = inspect.signature(cls.__init__)
+                    sig = get_signature(cls.__init__)
                     param = sig.parameters.get(param_name)
                     if param and param.default is not inspect.Parameter.empty:
                         # Skip parameters with default values
@@ -280,9 +264,9 @@ class DependencyResolver:
             # Create instance
             return cls(**resolved_args)
 
+        except (DependencyNotFoundError, CircularDependencyError):
+            raise
         except Exception as e:
-            if isinstance(e, DependencyNotFoundError | CircularDependencyError):
-                raise
             msg = f"Failed to instantiate {cls}: {e}"
             raise InjectionError(msg) from e
 
@@ -297,16 +281,14 @@ class DependencyResolver:
             for param_name, param_type in dependencies.items():
                 try:
                     # First try to resolve by parameter name (string key)
-                    if self.registry.has_binding(
-                        param_name
-                    ) or self.registry.has_factory(param_name):
+                    if param_name in self.registry:
                         resolved_args[param_name] = self.resolve(param_name)
                     else:
                         # Fall back to type-based resolution
                         resolved_args[param_name] = self.resolve(param_type)
                 except DependencyNotFoundError:  # noqa: PERF203
                     # Check if parameter has a default value
-                    sig = inspect.signature(factory)
+                    sig = get_signature(factory)
                     param = sig.parameters.get(param_name)
                     if param and param.default is not inspect.Parameter.empty:
                         # Skip parameters with default values
@@ -316,9 +298,9 @@ class DependencyResolver:
             # Invoke factory
             return factory(**resolved_args)
 
+        except (DependencyNotFoundError, CircularDependencyError):
+            raise
         except Exception as e:
-            if isinstance(e, DependencyNotFoundError | CircularDependencyError):
-                raise
             msg = f"Failed to invoke factory {factory}: {e}"
             raise InjectionError(msg) from e
 
@@ -333,16 +315,14 @@ class DependencyResolver:
             for param_name, param_type in dependencies.items():
                 try:
                     # First try to resolve by parameter name (string key)
-                    if self.registry.has_binding(
-                        param_name
-                    ) or self.registry.has_factory(param_name):
+                    if param_name in self.registry:
                         resolved_args[param_name] = await self.resolve_async(param_name)
                     else:
                         # Fall back to type-based resolution
                         resolved_args[param_name] = await self.resolve_async(param_type)
                 except DependencyNotFoundError:  # noqa: PERF203
                     # Check if parameter has a default value
-                    sig = inspect.signature(cls.__init__)
+                    sig = get_signature(cls.__init__)
                     param = sig.parameters.get(param_name)
                     if param and param.default is not inspect.Parameter.empty:
                         # Skip parameters with default values
@@ -352,9 +332,9 @@ class DependencyResolver:
             # Create instance
             return cls(**resolved_args)
 
+        except (DependencyNotFoundError, CircularDependencyError):
+            raise
         except Exception as e:
-            if isinstance(e, DependencyNotFoundError | CircularDependencyError):
-                raise
             msg = f"Failed to instantiate {cls}: {e}"
             raise InjectionError(msg) from e
 
@@ -369,16 +349,14 @@ class DependencyResolver:
             for param_name, param_type in dependencies.items():
                 try:
                     # First try to resolve by parameter name (string key)
-                    if self.registry.has_binding(
-                        param_name
-                    ) or self.registry.has_factory(param_name):
+                    if param_name in self.registry:
                         resolved_args[param_name] = await self.resolve_async(param_name)
                     else:
                         # Fall back to type-based resolution
                         resolved_args[param_name] = await self.resolve_async(param_type)
                 except DependencyNotFoundError:  # noqa: PERF203
                     # Check if parameter has a default value
-                    sig = inspect.signature(factory)
+                    sig = get_signature(factory)
                     param = sig.parameters.get(param_name)
                     if param and param.default is not inspect.Parameter.empty:
                         # Skip parameters with default values
@@ -388,9 +366,9 @@ class DependencyResolver:
             # Invoke factory
             return await factory(**resolved_args)
 
+        except (DependencyNotFoundError, CircularDependencyError):
+            raise
         except Exception as e:
-            if isinstance(e, DependencyNotFoundError | CircularDependencyError):
-                raise
             msg = f"Failed to invoke async factory {factory}: {e}"
             raise InjectionError(msg) from e
 
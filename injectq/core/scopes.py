@@ -1,14 +1,18 @@
 """Scope management for InjectQ dependency injection library."""
 
 import asyncio
+import contextvars
+import functools
 import logging
+import sys
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterator
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from enum import Enum
 from typing import Any
 
-from injectq.utils import ScopeError, ThreadLocalStorage
+from injectq.utils import ScopeError
 
 from .base_scope_manager import BaseScopeManager
 from .thread_safety import HybridLock
@@ -16,9 +20,18 @@ from .thread_safety import HybridLock
 
 _logger = logging.getLogger("injectq.core")
 
+# Sentinel for cache misses, so a cached None is still a hit
+_MISSING = object()
 
-class ScopeType(Enum):
-    """Built-in scope types."""
+# Stands in for the lock of scope managers built with thread_safe=False
+_NO_LOCK = nullcontext()
+
+
+class ScopeType(str, Enum):
+    """Built-in scope types.
+
+    Members are strings, so they work directly as scope names.
+    """
 
     SINGLETON = "singleton"
     TRANSIENT = "transient"
@@ -26,14 +39,30 @@ class ScopeType(Enum):
     ACTION = "action"
 
 
+# Names of the built-in scopes, keyed by both enum member and name
+_SCOPE_NAMES: dict[Any, str] = {
+    **{scope_type: scope_type.value for scope_type in ScopeType},
+    **{scope_type.value: scope_type.value for scope_type in ScopeType},
+}
+
+
 class Scope(ABC):
     """Abstract base class for dependency scopes."""
 
-    def __init__(self, name: str, thread_safe: bool = True) -> None:
+    __slots__ = ("_lock", "name", "thread_safe")
+
+    def __init__(
+        self,
+        name: str,
+        thread_safe: bool = True,
+        *,
+        lock_factory: Callable[[], "HybridLock | threading.RLock"] = HybridLock,
+    ) -> None:
         self.name = name
         self.thread_safe = thread_safe
+        self._lock: HybridLock | threading.RLock | None
         if thread_safe:
-            self._lock = HybridLock()
+            self._lock = lock_factory()
         else:
             self._lock = None
 
@@ -67,40 +96,64 @@ class Scope(ABC):
 class SingletonScope(Scope):
     """Scope that maintains a single instance per key for the application lifetime."""
 
+    __slots__ = ("_instances",)
+
     def __init__(self, thread_safe: bool = True) -> None:
-        super().__init__("singleton", thread_safe)
+        # Only ever taken synchronously; a plain RLock skips HybridLock's
+        # Python-level dispatch. It must be reentrant, since factories
+        # resolve their own singleton dependencies while it is held.
+        super().__init__("singleton", thread_safe, lock_factory=threading.RLock)
         self._instances: dict[Any, Any] = {}
 
     def get(self, key: Any, factory: Callable[[], Any]) -> Any:
         """Get or create a singleton instance."""
-
-        def get_or_create() -> Any:
-            if key not in self._instances:
-                _logger.debug("Creating singleton instance for key: %s", key)
-                self._instances[key] = factory()
-            else:
+        # Existing instances never change, so hits skip the lock; misses
+        # check again under it so the factory runs once per key
+        instance = self._instances.get(key, _MISSING)
+        if instance is not _MISSING:
+            return instance
+
+        with self._lock or _NO_LOCK:
+            instance = self._instances.get(key, _MISSING)
+            if instance is _MISSING:
+                if _logger.isEnabledFor(logging.DEBUG):
+                    _logger.debug("Creating singleton instance for key: %s", key)
+                instance = self._instances[key] = factory()
+            elif _logger.isEnabledFor(logging.DEBUG):
                 _logger.debug("Reusing singleton instance for key: %s", key)
-            return self._instances[key]
-
-        return self._safe_execute(get_or_create)
+            return instance
 
     async def aget(self, key: Any, factory: Callable[[], Any]) -> Any:
         """Async get or create a singleton instance."""
 
         async def aget_or_create() -> Any:
-            if key not in self._instances:
-                _logger.debug("Creating singleton instance (async) for key: %s", key)
-                result = factory()
-                if asyncio.iscoroutine(result):
-                    result = await result
-                self._instances[key] = result
-            else:
+            instance = self._instances.get(key, _MISSING)
+            if instance is _MISSING:
+                if _logger.isEnabledFor(logging.DEBUG):
+                    _logger.debug(
+                        "Creating singleton instance (async) for key: %s", key
+                    )
+                instance = factory()
+                if asyncio.iscoroutine(instance):
+                    instance = await instance
+                self._instances[key] = instance
+            elif _logger.isEnabledFor(logging.DEBUG):
                 _logger.debug("Reusing singleton instance (async) for key: %s", key)
-            return self._instances[key]
+            return instance
 
         # For async, we don't use _safe_execute as it's sync
         return await aget_or_create()
 
+    def swap_instances(self, instances: dict[Any, Any]) -> dict[Any, Any]:
+        """Replace all cached instances, returning the previous ones."""
+
+        def swap() -> dict[Any, Any]:
+            previous = self._instances
+            self._instances = instances
+            return previous
+
+        return self._safe_execute(swap)
+
     def clear(self) -> None:
         """Clear all singleton instances."""
         _logger.debug("Clearing singleton scope")
@@ -110,17 +163,21 @@ class SingletonScope(Scope):
 class TransientScope(Scope):
     """Scope that creates a new instance on every request."""
 
+    __slots__ = ()
+
     def __init__(self, thread_safe: bool = True) -> None:
         super().__init__("transient", thread_safe)
 
     def get(self, key: Any, factory: Callable[[], Any]) -> Any:
         """Always create a new instance."""
-        _logger.debug("Creating new transient instance for key: %s", key)
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Creating new transient instance for key: %s", key)
         return factory()
 
     async def aget(self, key: Any, factory: Callable[[], Any]) -> Any:
         """Always create a new instance asynchronously."""
-        _logger.debug("Creating new transient instance (async) for key: %s", key)
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Creating new transient instance (async) for key: %s", key)
         result = factory()
         if asyncio.iscoroutine(result):
             return await result
@@ -134,57 +191,50 @@ class TransientScope(Scope):
 class ThreadLocalScope(Scope):
     """Base class for thread-local scopes."""
 
+    __slots__ = ("_local",)
+
     def __init__(self, name: str, thread_safe: bool = True) -> None:
         super().__init__(name, thread_safe)
-        self._storage = ThreadLocalStorage()
+        # Each thread only ever sees its own instances dict, so no lock is
+        # needed around it.
+        self._local = threading.local()
+
+    def _instances(self) -> dict[Any, Any]:
+        """Get the calling thread's instances dict, creating it if needed."""
+        instances = getattr(self._local, "instances", None)
+        if instances is None:
+            instances = self._local.instances = {}
+        return instances
 
     def get(self, key: Any, factory: Callable[[], Any]) -> Any:
         """Get or create an instance in thread-local storage."""
-
-        def get_or_create() -> Any:
-            instances_key = f"{self.name}_instances"
-            instances = self._storage.get(instances_key, {})
-
-            if key not in instances:
-                instances[key] = factory()
-                self._storage.set(instances_key, instances)
-
-            return instances[key]
-
-        return self._safe_execute(get_or_create)
+        instances = self._instances()
+        instance = instances.get(key, _MISSING)
+        if instance is _MISSING:
+            instance = instances[key] = factory()
+        return instance
 
     async def aget(self, key: Any, factory: Callable[[], Any]) -> Any:
         """Async get or create an instance in thread-local storage."""
-
-        async def aget_or_create() -> Any:
-            instances_key = f"{self.name}_instances"
-            instances = self._storage.get(instances_key, {})
-
-            if key not in instances:
-                result = factory()
-                if asyncio.iscoroutine(result):
-                    result = await result
-                instances[key] = result
-                self._storage.set(instances_key, instances)
-
-            return instances[key]
-
-        # For async, we don't use _safe_execute as it's sync
-        return await aget_or_create()
+        instances = self._instances()
+        instance = instances.get(key, _MISSING)
+        if instance is _MISSING:
+            instance = factory()
+            if asyncio.iscoroutine(instance):
+                instance = await instance
+            instances[key] = instance
+        return instance
 
     def clear(self) -> None:
         """Clear thread-local instances."""
-
-        def clear_storage() -> None:
-            instances_key = f"{self.name}_instances"
-            self._storage.delete(instances_key)
-
-        self._safe_execute(clear_storage)
+        self._local.__dict__.pop("instances", None)
 
 
 class RequestScope(ThreadLocalScope):
     """Scope for web request lifetime."""
 
+    __slots__ = ()
+
     def __init__(self, thread_safe: bool = True) -> None:
         super().__init__("request", thread_safe)
 
@@ -192,6 +242,8 @@ class RequestScope(ThreadLocalScope):
 class ActionScope(ThreadLocalScope):
     """Scope for individual action/operation lifetime."""
 
+    __slots__ = ()
+
     def __init__(self, thread_safe: bool = True) -> None:
         super().__init__("action", thread_safe)
 
@@ -199,9 +251,34 @@ class ActionScope(ThreadLocalScope):
 class ScopeManager(BaseScopeManager):
     """Manages scopes and scope contexts."""
 
+    __slots__ = (
+        "_lock",
+        "_scope_factories",
+        "_scopes",
+        "_stack_var",
+        "_transient_name",
+        "thread_safe",
+    )
+
     def __init__(self, thread_safe: bool = True) -> None:
+        # Copy-on-write: writers publish a new dict under the lock, so
+        # get_scope and clear_all_scopes read it without locking
         self._scopes: dict[str, Scope] = {}
-        self._current_scopes = ThreadLocalStorage()
+        # Built-in scopes are created on first use, so unused ones cost nothing
+        self._scope_factories: dict[str, Callable[[], Scope]] = {
+            name: functools.partial(scope_class, thread_safe)
+            for name, scope_class in (
+                ("singleton", SingletonScope),
+                ("transient", TransientScope),
+                ("request", RequestScope),
+                ("action", ActionScope),
+            )
+        }
+        self._transient_name: str | None = sys.intern("transient")
+        # Names of the scopes entered in the current thread or task
+        self._stack_var: contextvars.ContextVar[tuple[str, ...]] = (
+            contextvars.ContextVar("scope_stack", default=())
+        )
         self.thread_safe = thread_safe
 
         if thread_safe:
@@ -209,41 +286,44 @@ class ScopeManager(BaseScopeManager):
         else:
             self._lock = None
 
-        # Register built-in scopes
-        self.register_scope(SingletonScope(thread_safe))
-        self.register_scope(TransientScope(thread_safe))
-        self.register_scope(RequestScope(thread_safe))
-        self.register_scope(ActionScope(thread_safe))
-
-    def _safe_execute(self, operation: Callable) -> Any:
-        """Execute operation with thread safety if enabled."""
-        if self.thread_safe and self._lock:
-            with self._lock:
-                return operation()
-        else:
-            return operation()
-
     def register_scope(self, scope: Scope) -> None:
         """Register a new scope."""
-        self._safe_execute(lambda: self._scopes.__setitem__(scope.name, scope))
+        name = sys.intern(scope.name)
+        if name == "transient":
+            # get_instance calls factories directly only for the built-in scope
+            self._transient_name = name if type(scope) is TransientScope else None
+        with self._lock or _NO_LOCK:
+            self._scopes = {**self._scopes, name: scope}
 
     def get_scope(self, scope_name: str) -> Scope:
         """Get a scope by name."""
-
-        def get() -> Scope:
-            if scope_name not in self._scopes:
-                msg = f"Unknown scope: {scope_name}"
-                raise ScopeError(msg)
-            return self._scopes[scope_name]
-
-        return self._safe_execute(get)
+        scope = self._scopes.get(scope_name)
+        if scope is not None:
+            return scope
+        with self._lock or _NO_LOCK:
+            scope = self._scopes.get(scope_name)
+            if scope is None:
+                factory = self._scope_factories.get(scope_name)
+                if factory is None:
+                    msg = f"Unknown scope: {scope_name}"
+                    raise ScopeError(msg)
+                scope = factory()
+                name = _SCOPE_NAMES.get(scope_name, scope_name)
+                self._scopes = {**self._scopes, name: scope}
+            return scope
 
     def resolve_scope_name(self, scope: Any) -> str:
         """Resolve scope name from various input types."""
+        try:
+            name = _SCOPE_NAMES.get(scope)
+        except TypeError:
+            # Unhashable input; reported as an invalid scope type below
+            name = None
+        if name is not None:
+            return name
         if isinstance(scope, str):
-            return scope
-        if isinstance(scope, ScopeType):
-            return scope.value
+            # Interned names compare by identity against the scope table keys
+            return sys.intern(scope)
         if isinstance(scope, Scope):
             return scope.name
         msg = f"Invalid scope type: {type(scope)}"
@@ -255,25 +335,22 @@ class ScopeManager(BaseScopeManager):
         scope = self.get_scope(scope_name)
 
         # Track current scope stack
-        current_scopes = self._current_scopes.get("stack", [])
-        current_scopes.append(scope_name)
-        self._current_scopes.set("stack", current_scopes)
+        token = self._stack_var.set((*self._stack_var.get(), scope_name))
 
         try:
             scope.enter()
             yield
         finally:
             scope.exit()
-            current_scopes.pop()
-            if current_scopes:
-                self._current_scopes.set("stack", current_scopes)
-            else:
-                self._current_scopes.delete("stack")
+            self._stack_var.reset(token)
 
     def get_instance(
         self, key: Any, factory: Callable[[], Any], scope_name: str = "singleton"
     ) -> Any:
         """Get an instance from the specified scope."""
+        if scope_name is self._transient_name:
+            # TransientScope.get would just call the factory
+            return factory()
         scope = self.get_scope(scope_name)
         return scope.get(key, factory)
 
@@ -281,6 +358,12 @@ class ScopeManager(BaseScopeManager):
         self, key: Any, factory: Callable[[], Any], scope_name: str = "singleton"
     ) -> Any:
         """Async get an instance from the specified scope."""
+        if scope_name is self._transient_name:
+            # Same as TransientScope.aget, without the scope lookup
+            result = factory()
+            if asyncio.iscoroutine(result):
+                result = await result
+            return result
         scope = self.get_scope(scope_name)
         return await scope.aget(key, factory)
 
@@ -291,18 +374,22 @@ class ScopeManager(BaseScopeManager):
 
     def clear_all_scopes(self) -> None:
         """Clear all instances in all scopes."""
-
-        def clear_all() -> None:
-            for scope in self._scopes.values():
-                scope.clear()
-
-        self._safe_execute(clear_all)
+        # The table is never mutated in place, so this iterates a snapshot
+        # without holding the manager lock while each scope clears
+        for scope in self._scopes.values():
+            scope.clear()
 
 
-# Global scope manager instance
-_scope_manager = ScopeManager()
+# Global scope manager instance, created on first use
+_scope_manager: ScopeManager | None = None
+_scope_manager_lock = threading.Lock()
 
 
 def get_scope_manager() -> ScopeManager:
     """Get the global scope manager."""
+    global _scope_manager  # noqa: PLW0603
+    if _scope_manager is None:
+        with _scope_manager_lock:
+            if _scope_manager is None:
+                _scope_manager = ScopeManager()
     return _scope_manager
@@ -14,11 +14,12 @@ from injectq.utils import (
     format_type_name,
     get_class_constructor_dependencies,
     get_function_dependencies,
+    get_signature,
     is_injectable_class,
 )
 
 from .base_scope_manager import BaseScopeManager
-from .registry import ServiceBinding, ServiceRegistry
+from .registry import _FACTORY, ServiceBinding, ServiceRegistry
 from .scopes import get_scope_manager
 from .thread_safety import HybridLock
 
@@ -111,15 +112,13 @@ class ThreadSafeDependencyResolver:
 
     def _do_resolve(self, service_type: ServiceKey) -> Any:
         """Internal method to perform the actual resolution."""
-        # Check if it's a factory binding
-        factory = self.registry.get_factory(service_type)
-        if factory is not None:
-            return self._resolve_factory(service_type, factory)
-
-        # Check if it's a regular binding
-        binding = self.registry.get_binding(service_type)
-        if binding is not None:
-            return self._resolve_binding(binding)
+        # One probe tells a factory from a regular binding
+        entry = self.registry.get_entry(service_type)
+        if entry is not None:
+            kind, target = entry
+            if kind == _FACTORY:
+                return self._resolve_factory(service_type, target)
+            return self._resolve_binding(target)
 
         # Try to auto-bind if it's a concrete class
         if isinstance(service_type, type) and is_injectable_class(service_type):
@@ -130,15 +129,13 @@ class ThreadSafeDependencyResolver:
 
     async def _ado_resolve(self, service_type: ServiceKey) -> Any:
         """Internal async method to perform the actual resolution."""
-        # Check if it's a factory binding
-        factory = self.registry.get_factory(service_type)
-        if factory is not None:
-            return await self._aresolve_factory(service_type, factory)
-
-        # Check if it's a regular binding
-        binding = self.registry.get_binding(service_type)
-        if binding is not None:
-            return await self._aresolve_binding(binding)
+        # One probe tells a factory from a regular binding
+        entry = self.registry.get_entry(service_type)
+        if entry is not None:
+            kind, target = entry
+            if kind == _FACTORY:
+                return await self._aresolve_factory(service_type, target)
+            return await self._aresolve_binding(target)
 
         # Try to auto-bind if it's a concrete class
         if isinstance(service_type, type) and is_injectable_class(service_type):
@@ -292,16 +289,14 @@ class ThreadSafeDependencyResolver:
             for param_name, param_type in dependencies.items():
                 try:
                     # First try to resolve by parameter name (string key)
-                    if self.registry.has_binding(
-                        param_name
-                    ) or self.registry.has_factory(param_name):
+                    if param_name in self.registry:
                         resolved_args[param_name] = self.resolve(param_name)
                     else:
                         # Fall back to type-based resolution
                         resolved_args[param_name] = self.resolve(param_type)
                 except DependencyNotFoundError as e:  # noqa: PERF203
                     # Check if parameter has a default value
-                    sig = inspect.signature(cls.__init__)
+                    sig = get_signature(cls.__init__)
                     param = sig.parameters.get(param_name)
                     if param and param.default is not inspect.Parameter.empty:
                         # Skip parameters with default values
@@ -328,16 +323,14 @@ class ThreadSafeDependencyResolver:
             for param_name, param_type in dependencies.items():
                 try:
                     # First try to resolve by parameter name (string key)
-                    if self.registry.has_binding(
-                        param_name
-                    ) or self.registry.has_factory(param_name):
+                    if param_name in self.registry:
                         resolved_args[param_name] = await self.aresolve(param_name)
                     else:
                         # Fall back to type-based resolution
                         resolved_args[param_name] = await self.aresolve(param_type)
                 except DependencyNotFoundError as e:  # noqa: PERF203
                     # Check if parameter has a default value
-                    sig = inspect.signature(cls.__init__)
+                    sig = get_signature(cls.__init__)
                     param = sig.parameters.get(param_name)
                     if param and param.default is not inspect.Parameter.empty:
                         # Skip parameters with default values
@@ -364,16 +357,14 @@ class ThreadSafeDependencyResolver:
             for param_name, param_type in dependencies.items():
                 try:
                     # First try to resolve by parameter name (string key)
-                    if self.registry.has_binding(
-                        param_name
-                    ) or self.registry.has_factory(param_name):
+                    if param_name in self.registry:
                         resolved_args[param_name] = self.resolve(param_name)
                     else:
                         # Fall back to type-based resolution
                         resolved_args[param_name] = self.resolve(param_type)
                 except DependencyNotFoundError as e:  # noqa: PERF203
                     # Check if parameter has a default value
-                    sig = inspect.signature(factory)
+                    sig = get_signature(factory)
                     param = sig.parameters.get(param_name)
                     if param and param.default is not inspect.Parameter.empty:
                         # Skip parameters with default values
@@ -400,16 +391,14 @@ class ThreadSafeDependencyResolver:
             for param_name, param_type in dependencies.items():
                 try:
                     # First try to resolve by parameter name (string key)
-                    if self.registry.has_binding(
-                        param_name
-                    ) or self.registry.has_factory(param_name):
+                    if param_name in self.registry:
                         resolved_args[param_name] = await self.aresolve(param_name)
                     else:
                         # Fall back to type-based resolution
                         resolved_args[param_name] = await self.aresolve(param_type)
                 except DependencyNotFoundError as e:  # noqa: PERF203
                     # Check if parameter has a default value
-                    sig = inspect.signature(factory)
+                    sig = get_signature(factory)
                     param = sig.parameters.get(param_name)
                     if param and param.default is not inspect.Parameter.empty:
                         # Skip parameters with default values
@@ -3,7 +3,6 @@
 import asyncio
 import logging
 import threading
-import weakref
 from collections.abc import AsyncIterator, Callable, Iterator
 from contextlib import asynccontextmanager, contextmanager
 from typing import Any, Generic, TypeVar, cast
@@ -70,9 +69,6 @@ class HybridLock:
         # Per-thread asyncio locks stored in thread-local storage
         self._thread_local = threading.local()
 
-        # Track active locks for cleanup
-        self._active_locks: weakref.WeakSet = weakref.WeakSet()
-
     def _get_async_lock(self) -> asyncio.Lock | None:
         """Get or create an asyncio lock for the current thread."""
         if not hasattr(self._thread_local, "async_lock"):
@@ -81,7 +77,6 @@ class HybridLock:
                 asyncio.current_task()
                 lock = asyncio.Lock()
                 self._thread_local.async_lock = lock
-                self._active_locks.add(lock)
             except RuntimeError:
                 # Not in asyncio context, will use thread lock
                 self._thread_local.async_lock = None
@@ -96,7 +91,6 @@ class HybridLock:
                 asyncio.current_task()
                 lock = ReentrantAsyncLock()
                 self._thread_local.reentrant_lock = lock
-                self._active_locks.add(lock)
             except RuntimeError:
                 # Not in asyncio context, will use thread lock
                 self._thread_local.reentrant_lock = None
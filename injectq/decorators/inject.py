@@ -1,30 +1,63 @@
 import functools
 import inspect
 import logging
+import sys
 from collections.abc import Callable
-from typing import Any, Generic, TypeVar, cast, overload
+from typing import Any, Generic, NamedTuple, TypeVar, cast, overload
 
 from injectq.core import InjectQ
 from injectq.utils import (
     DependencyNotFoundError,
     InjectionError,
     get_function_dependencies,
+    get_signature,
+    is_injectable_class,
 )
 
 
-# Import at module level to avoid repeated imports
-try:
-    from injectq.core.context import ContainerContext
-except ImportError:
-    ContainerContext = None
-
-
 F = TypeVar("F", bound=Callable[..., Any])
 T = TypeVar("T")
 
 # Create a logger for the decorators module
 _logger = logging.getLogger("injectq.decorators")
 
+_KEYWORD_ONLY = sys.maxsize
+
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
+
+class _Injection(NamedTuple):
+    """How the wrapper fills one injectable parameter."""
+
+    name: str
+    service_key: Any
+    from_marker: bool
+    has_default: bool
+    # Index a positional argument for the parameter would take, or
+    # _KEYWORD_ONLY when it can only be passed by name
+    position: int
+    # A defaulted parameter whose service key cannot be auto-resolved, so it
+    # is only injected when the container has a registration for it
+    optional: bool
+
+
+class _CallPlan(NamedTuple):
+    """Everything the wrapper needs per call, computed at decoration time."""
+
+    func: Callable
+    signature: inspect.Signature
+    injections: tuple[_Injection, ...]
+    # Positional-only injectables cannot be passed by keyword, so those
+    # functions still go through Signature.bind_partial
+    bind_args: bool
+    # Used to reject calls that cannot bind before resolving anything
+    max_positional: int
+    keyword_positions: dict[str, int]
+    unknown_keyword_position: int
+
 
 @overload
 def inject(func: F) -> F: ...
@@ -75,9 +108,10 @@ def inject(
             _logger.exception(msg)
             raise InjectionError(msg)
 
-        # Analyze function dependencies
+        # Analyze function dependencies; the signature is computed once here
+        # rather than on every call of the wrapper.
         try:
-            dependencies = get_function_dependencies(f)
+            plan = _build_call_plan(f, get_signature(f), get_function_dependencies(f))
             _logger.debug("Dependencies analyzed for function: %s", f.__name__)
         except Exception as e:
             msg = f"Failed to analyze dependencies for {f.__name__}: {e}"
@@ -89,16 +123,11 @@ def inject(
             @functools.wraps(f)
             async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
                 _logger.debug("Calling async function: %s", f.__name__)
-                # Get the container at call time
-                target_container = container
-                if not target_container:
-                    target_container = (
-                        ContainerContext.get_current() if ContainerContext else None
-                    )
-                if not target_container:
-                    target_container = InjectQ.get_instance()
+                # Get the container at call time; get_instance() already
+                # prefers the active context container.
+                target_container = container or InjectQ.get_instance()
                 return await _inject_and_call_async(
-                    f, dependencies, target_container, args, kwargs
+                    plan, target_container, args, kwargs
                 )
 
             return cast("F", async_wrapper)
@@ -106,15 +135,10 @@ def inject(
         @functools.wraps(f)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
             _logger.debug("Calling sync function: %s", f.__name__)
-            # Get the container at call time
-            target_container = container
-            if not target_container:
-                target_container = (
-                    ContainerContext.get_current() if ContainerContext else None
-                )
-            if not target_container:
-                target_container = InjectQ.get_instance()
-            return _inject_and_call(f, dependencies, target_container, args, kwargs)
+            # Get the container at call time; get_instance() already
+            # prefers the active context container.
+            target_container = container or InjectQ.get_instance()
+            return _inject_and_call(plan, target_container, args, kwargs)
 
         return cast("F", sync_wrapper)
 
@@ -128,50 +152,159 @@ def inject(
     return _inject_decorator(func)
 
 
+def _build_injection_plan(
+    sig: inspect.Signature, dependencies: dict[str, type]
+) -> tuple[_Injection, ...]:
+    """Precompute how the wrapper fills each injectable parameter.
+
+    A parameter defaulting to an ``Inject[...]`` marker resolves the marker's
+    service type; any other parameter is looked up by name, then by type.
+    """
+
+    def optional(service_key: Any) -> bool:
+        auto_resolved = isinstance(service_key, type) and is_injectable_class(
+            service_key
+        )
+        return not auto_resolved
+
+    positions = {
+        name: index
+        for index, name in enumerate(
+            name
+            for name, param in sig.parameters.items()
+            if param.kind in _POSITIONAL_KINDS
+        )
+    }
+    plan = []
+    for param_name, param_type in dependencies.items():
+        param = sig.parameters.get(param_name)
+        default = inspect.Parameter.empty if param is None else param.default
+        position = positions.get(param_name, _KEYWORD_ONLY)
+        if isinstance(default, Inject):
+            service_key = default.service_type
+            plan.append(
+                _Injection(
+                    param_name,
+                    service_key,
+                    from_marker=True,
+                    has_default=True,
+                    position=position,
+                    optional=optional(service_key),
+                )
+            )
+        else:
+            has_default = default is not inspect.Parameter.empty
+            plan.append(
+                _Injection(
+                    param_name,
+                    param_type,
+                    from_marker=False,
+                    has_default=has_default,
+                    position=position,
+                    optional=has_default and optional(param_type),
+                )
+            )
+    return tuple(plan)
+
+
+def _build_call_plan(
+    func: Callable, sig: inspect.Signature, dependencies: dict[str, type]
+) -> _CallPlan:
+    """Bundle the injection plan with what is needed to check call arguments."""
+    injections = _build_injection_plan(sig, dependencies)
+    parameters = sig.parameters
+    bind_args = any(
+        parameters[entry.name].kind is inspect.Parameter.POSITIONAL_ONLY
+        for entry in injections
+        if entry.name in parameters
+    )
+
+    max_positional = 0
+    keyword_positions = {}
+    unknown_keyword_position = -1
+    for name, param in parameters.items():
+        if param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            keyword_positions[name] = max_positional
+        elif param.kind is inspect.Parameter.KEYWORD_ONLY:
+            keyword_positions[name] = _KEYWORD_ONLY
+        elif param.kind is inspect.Parameter.VAR_POSITIONAL:
+            max_positional = _KEYWORD_ONLY
+        elif param.kind is inspect.Parameter.VAR_KEYWORD:
+            # Unknown names, including positional-only ones, land in **kwargs
+            unknown_keyword_position = _KEYWORD_ONLY
+        if param.kind in _POSITIONAL_KINDS:
+            max_positional += 1
+
+    return _CallPlan(
+        func,
+        sig,
+        injections,
+        bind_args,
+        max_positional,
+        keyword_positions,
+        unknown_keyword_position,
+    )
+
+
+def _check_arguments(plan: _CallPlan, args: tuple, kwargs: dict) -> None:
+    """Raise the TypeError binding would, before any dependency is resolved.
+
+    A keyword argument is rejected when its position is already taken by a
+    positional argument; unknown names count as position -1 unless the
+    function accepts ``**kwargs``.
+    """
+    nargs = len(args)
+    if nargs > plan.max_positional or any(
+        plan.keyword_positions.get(name, plan.unknown_keyword_position) < nargs
+        for name in kwargs
+    ):
+        plan.signature.bind_partial(*args, **kwargs)
+
+
 async def _inject_and_call_async(
-    func: Callable,
-    dependencies: dict[str, type],
-    container: InjectQ,
-    args: tuple,
-    kwargs: dict,
+    plan: _CallPlan, container: InjectQ, args: tuple, kwargs: dict
 ) -> Any:
     """Helper function to inject dependencies and call the async function."""
+    func = plan.func
     try:
-        # Get function signature
-        sig = inspect.signature(func)
-        bound_args = sig.bind_partial(*args, **kwargs)
-
-        # Inject missing dependencies
-        for param_name, param_type in dependencies.items():
-            if param_name not in bound_args.arguments:
-                try:
-                    # If an explicit Inject(...) marker is provided as default, honor it
-                    param = sig.parameters.get(param_name)
-                    if param and isinstance(param.default, Inject):
-                        dependency = await container.aget(param.default.service_type)
-                        bound_args.arguments[param_name] = dependency
-                        continue
-                    # First try to resolve by parameter name (string key)
-                    if container.has(param_name):
-                        dependency = await container.aget(param_name)
-                    else:
-                        # Fall back to type-based resolution
-                        dependency = await container.aget(param_type)
-                    bound_args.arguments[param_name] = dependency
-                except DependencyNotFoundError:
-                    # Check if parameter has a default value
-                    param = sig.parameters.get(param_name)
-                    if param and param.default is not inspect.Parameter.empty:
-                        # Skip parameters with default values
-                        continue
-                    # Re-raise if no default value
-                    raise
-
-        # Apply defaults for remaining parameters
-        bound_args.apply_defaults()
+        _check_arguments(plan, args, kwargs)
+        # Inject missing dependencies; a parameter is already supplied when
+        # the call passed it positionally or by keyword.
+        nargs = len(args)
+        injected = {}
+        for entry in plan.injections:
+            param_name, service_key, from_marker, has_default, position, optional = (
+                entry
+            )
+            if position < nargs or param_name in kwargs:
+                continue
+            if not from_marker and container.has(param_name):
+                # First try to resolve by parameter name (string key)
+                lookup = param_name
+            elif optional and not container.has(service_key):
+                # Nothing can provide it, so keep the default without
+                # raising and catching DependencyNotFoundError
+                continue
+            else:
+                # An explicit Inject(...) marker default names the service;
+                # otherwise fall back to type-based resolution
+                lookup = service_key
+            try:
+                dependency = await container.aget(lookup)
+            except DependencyNotFoundError:
+                if has_default:
+                    # Skip parameters with default values
+                    continue
+                raise
+            injected[param_name] = dependency
+
+        if plan.bind_args:
+            bound_args = plan.signature.bind_partial(*args, **kwargs)
+            bound_args.arguments.update(injected)
+            return await func(*bound_args.args, **bound_args.kwargs)
 
         # Call the function
-        return await func(*bound_args.args, **bound_args.kwargs)
+        return await func(*args, **kwargs, **injected)
 
     except Exception as e:
         if isinstance(e, DependencyNotFoundError):
@@ -187,49 +320,49 @@ async def _inject_and_call_async(
 
 
 def _inject_and_call(
-    func: Callable,
-    dependencies: dict[str, type],
-    container: InjectQ,
-    args: tuple,
-    kwargs: dict,
+    plan: _CallPlan, container: InjectQ, args: tuple, kwargs: dict
 ) -> Any:
     """Helper function to inject dependencies and call the function."""
+    func = plan.func
     try:
-        # Get function signature
-        sig = inspect.signature(func)
-        bound_args = sig.bind_partial(*args, **kwargs)
-
-        # Inject missing dependencies
-        for param_name, param_type in dependencies.items():
-            if param_name not in bound_args.arguments:
-                try:
-                    # If an explicit Inject(...) marker is provided as default, honor it
-                    param = sig.parameters.get(param_name)
-                    if param and isinstance(param.default, Inject):
-                        dependency = container.get(param.default.service_type)
-                        bound_args.arguments[param_name] = dependency
-                        continue
-                    # First try to resolve by parameter name (string key)
-                    if container.has(param_name):
-                        dependency = container.get(param_name)
-                    else:
-                        # Fall back to type-based resolution
-                        dependency = container.get(param_type)
-                    bound_args.arguments[param_name] = dependency
-                except DependencyNotFoundError:
-                    # Check if parameter has a default value
-                    param = sig.parameters.get(param_name)
-                    if param and param.default is not inspect.Parameter.empty:
-                        # Skip parameters with default values
-                        continue
-                    # Re-raise if no default value
-                    raise
-
-        # Apply defaults for remaining parameters
-        bound_args.apply_defaults()
+        _check_arguments(plan, args, kwargs)
+        # Inject missing dependencies; a parameter is already supplied when
+        # the call passed it positionally or by keyword.
+        nargs = len(args)
+        injected = {}
+        for entry in plan.injections:
+            param_name, service_key, from_marker, has_default, position, optional = (
+                entry
+            )
+            if position < nargs or param_name in kwargs:
+                continue
+            if not from_marker and container.has(param_name):
+                # First try to resolve by parameter name (string key)
+                lookup = param_name
+            elif optional and not container.has(service_key):
+                # Nothing can provide it, so keep the default without
+                # raising and catching DependencyNotFoundError
+                continue
+            else:
+                # An explicit Inject(...) marker default names the service;
+                # otherwise fall back to type-based resolution
+                lookup = service_key
+            try:
+                dependency = container.get(lookup)
+            except DependencyNotFoundError:
+                if has_default:
+                    # Skip parameters with default values
+                    continue
+                raise
+            injected[param_name] = dependency
+
+        if plan.bind_args:
+            bound_args = plan.signature.bind_partial(*args, **kwargs)
+            bound_args.arguments.update(injected)
+            return func(*bound_args.args, **bound_args.kwargs)
 
         # Call the function
-        return func(*bound_args.args, **bound_args.kwargs)
+        return func(*args, **kwargs, **injected)
 
     except Exception as e:
         if isinstance(e, DependencyNotFoundError):
@@ -264,14 +397,20 @@ class Inject(Generic[T], metaclass=_InjectMeta):
             a.hello()
     """
 
+    # One marker per injectable parameter default; no per-instance __dict__
+    __slots__ = ("_injected_value", "service_type")
+
     def __init__(self, service_type: type[T]) -> None:
         self.service_type = service_type
         # Use a special object to signify that the value has not been resolved yet.
         self._injected_value: Any = None
-        _logger.debug(
-            "Inject proxy created for service type: %s",
-            getattr(service_type, "__name__", str(service_type)),
-        )
+        # Inject[...] runs for every decorated default; skip the name
+        # formatting unless debug logging is actually on.
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "Inject proxy created for service type: %s",
+                getattr(service_type, "__name__", str(service_type)),
+            )
 
     def _resolve(self) -> T:
         """Resolves the dependency from the container if it hasn't been already."""
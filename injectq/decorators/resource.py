@@ -2,7 +2,6 @@
 
 import inspect
 import logging
-import weakref
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator, Callable, Iterator
 from contextlib import asynccontextmanager, contextmanager, suppress
@@ -234,7 +233,6 @@ class ResourceManager:
 
     def __init__(self) -> None:
         self._resources: dict[str, ResourceLifecycle] = {}
-        self._finalizers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
     def register_resource(self, name: str, lifecycle: ResourceLifecycle) -> None:
         """Register a resource lifecycle."""
@@ -294,14 +292,15 @@ class ResourceManager:
 
     def shutdown_all(self) -> None:
         """Shutdown all synchronous resources."""
-        for lifecycle in self._resources.values():
+        # Snapshot, as cleanup code may register further resources
+        for lifecycle in tuple(self._resources.values()):
             if lifecycle.initialized and not lifecycle.is_async:
                 with suppress(Exception):
                     lifecycle.shutdown()
 
     async def shutdown_all_async(self) -> None:
         """Shutdown all resources (both sync and async)."""
-        for lifecycle in self._resources.values():
+        for lifecycle in tuple(self._resources.values()):
             if lifecycle.initialized:
                 with suppress(Exception):
                     if lifecycle.is_async:
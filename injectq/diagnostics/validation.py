@@ -12,6 +12,10 @@ from injectq.utils.types import ServiceKey
 
 _logger = logging.getLogger("injectq.diagnostics")
 
+# DFS node colors for cycle detection
+_VISITING = 1
+_DONE = 2
+
 
 class ValidationError(InjectQError):
     """Errors related to dependency validation."""
@@ -177,11 +181,12 @@ class DependencyValidator:
 
     def _validate_circular_dependencies(self, result: "ValidationResult") -> None:
         """Validate that there are no circular dependencies."""
-        visited = set()
-        recursion_stack = set()
+        # Node colors: absent (unvisited), _VISITING (on the DFS path), _DONE
+        color: dict[ServiceKey, int] = {}
 
         def dfs(service_key: ServiceKey, path: list[ServiceKey]) -> bool:
-            if service_key in recursion_stack:
+            state = color.get(service_key)
+            if state == _VISITING:
                 # Found circular dependency
                 cycle_start = path.index(service_key)
                 cycle = [*path[cycle_start:], service_key]
@@ -191,22 +196,21 @@ class DependencyValidator:
                 result.errors.append(ValidationError(error_msg))
                 return False
 
-            if service_key in visited:
+            if state == _DONE:
                 return True
 
-            visited.add(service_key)
-            recursion_stack.add(service_key)
+            color[service_key] = _VISITING
 
             for dependency in self._dependency_graph.get(service_key, set()):
                 if not dfs(dependency, [*path, service_key]):
                     return False
 
-            recursion_stack.remove(service_key)
+            color[service_key] = _DONE
             return True
 
         # Check all services
         for service_key in self._dependency_graph:
-            if service_key not in visited:
+            if service_key not in color:
                 dfs(service_key, [])
 
     def _validate_missing_dependencies(self, result: "ValidationResult") -> None:
@@ -14,6 +14,11 @@ from injectq.utils.exceptions import InjectQError
 from injectq.utils.types import ServiceKey
 
 
+# DFS node colors for cycle detection
+_VISITING = 1
+_DONE = 2
+
+
 class VisualizationError(InjectQError):
     """Errors related to dependency visualization."""
 
@@ -69,11 +74,11 @@ class DependencyVisualizer:
         registry = self.container._registry  # noqa: SLF001
 
         # Analyze bindings
-        for service_key, binding in registry._bindings.items():  # noqa: SLF001
+        for service_key, binding in registry.get_all_bindings().items():
             self._analyze_binding(service_key, binding)
 
         # Analyze factories
-        for service_key, factory in registry._factories.items():  # noqa: SLF001
+        for service_key, factory in registry.get_all_factories().items():
             self._analyze_factory(service_key, factory)
         _logger.debug("Dependency graph analyzed for visualization")
 
@@ -453,30 +458,30 @@ class DependencyVisualizer:
             List of cycles, where each cycle is a list of service keys
         """
         cycles = []
-        visited = set()
-        recursion_stack = set()
+        # Node colors: absent (unvisited), _VISITING (on the DFS path), _DONE
+        color: dict[ServiceKey, int] = {}
 
         def dfs(service_key: ServiceKey, path: list[ServiceKey]) -> None:
-            if service_key in recursion_stack:
+            state = color.get(service_key)
+            if state == _VISITING:
                 # Found cycle
                 cycle_start = path.index(service_key)
                 cycle = [*path[cycle_start:], service_key]
                 cycles.append(cycle)
                 return
 
-            if service_key in visited:
+            if state == _DONE:
                 return
 
-            visited.add(service_key)
-            recursion_stack.add(service_key)
+            color[service_key] = _VISITING
 
             for dependency in self._dependency_graph.get(service_key, set()):
                 dfs(dependency, [*path, service_key])
 
-            recursion_stack.remove(service_key)
+            color[service_key] = _DONE
 
         for service_key in self._dependency_graph:
-            if service_key not in visited:
+            if service_key not in color:
                 dfs(service_key, [])
 
         return cycles
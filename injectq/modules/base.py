@@ -7,7 +7,12 @@ from contextlib import suppress
 from typing import Any, get_type_hints
 
 from injectq.core import ModuleBinder, ScopeType
-from injectq.utils import BindingError, ServiceKey, get_function_dependencies
+from injectq.utils import (
+    BindingError,
+    ServiceKey,
+    get_function_dependencies,
+    get_signature,
+)
 
 
 _logger = logging.getLogger("injectq.modules")
@@ -125,7 +130,7 @@ def provider(func: Callable) -> Callable:
         func: The provider function/method
 
     Returns:
-        The decorated function with provider metadata
+        The same function, marked as a provider (no wrapper is created)
     """
     # Mark the function as a provider
     func._is_provider = True  # type: ignore  # noqa: PGH003, SLF001
@@ -139,32 +144,64 @@ class ProviderModule(Module):
     instances of services. Their parameters are automatically injected.
     """
 
+    # Names of @provider methods, collected once per class
+    _provider_names: tuple[str, ...] = ()
+    # Return types of those providers, index-aligned with _provider_names.
+    # Filled by the first configure() of the class, since annotations may
+    # reference names that only exist once the defining module has loaded.
+    _provider_return_types: tuple[Any, ...] | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._provider_names = tuple(
+            attr_name
+            for attr_name in dir(cls)
+            if callable(attr := getattr(cls, attr_name, None))
+            and getattr(attr, "_is_provider", False)
+        )
+        cls._provider_return_types = None
+
     def configure(self, binder: ModuleBinder) -> None:
         """Configure bindings from provider methods."""
         _logger.info("Configuring ProviderModule: %s", self.__class__.__name__)
-        # Find all provider methods
-        provider_count = 0
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if callable(attr) and hasattr(attr, "_is_provider"):
-                provider_count += 1
-                _logger.debug("Found provider method: %s", attr_name)
-                self._configure_provider(binder, attr)
+        cls = type(self)
+        return_types = cls._provider_return_types
+        if return_types is None:
+            return_types = (None,) * len(self._provider_names)
+
+        resolved_types = []
+        for attr_name, return_type in zip(
+            self._provider_names, return_types, strict=True
+        ):
+            _logger.debug("Found provider method: %s", attr_name)
+            resolved_types.append(
+                self._configure_provider(binder, getattr(self, attr_name), return_type)
+            )
+        cls._provider_return_types = tuple(resolved_types)
+
         _logger.info(
             "Configured %d provider method(s) in %s",
-            provider_count,
+            len(resolved_types),
             self.__class__.__name__,
         )
 
     def _configure_provider(
-        self, binder: ModuleBinder, provider_method: Callable
-    ) -> None:
-        """Configure a binding from a provider method."""
-        try:
-            # Get return type annotation as the service type
+        self,
+        binder: ModuleBinder,
+        provider_method: Callable,
+        return_type: Any = None,
+    ) -> Any:
+        """Configure a binding from a provider method.
 
-            hints = get_type_hints(provider_method)
-            return_type = hints.get("return", None)
+        Returns:
+            The service type the provider was bound to
+        """
+        try:
+            # Get return type annotation as the service type, unless it is
+            # already known from an earlier install of this module class
+            if return_type is None:
+                hints = get_type_hints(provider_method)
+                return_type = hints.get("return", None)
 
             if return_type is None:
                 msg = f"Provider method {provider_method.__name__} must"
@@ -178,10 +215,24 @@ class ProviderModule(Module):
                 return_type,
             )
 
+            # Analyze the provider's dependencies once, at install time,
+            # rather than on every resolution of the factory. A bound method
+            # is analyzed through its class-level function, so the dependency
+            # cache never holds this module instance; self is skipped.
+            function = getattr(provider_method, "__func__", None)
+            if function is None:
+                dependencies = tuple(get_function_dependencies(provider_method).items())
+            else:
+                self_name = next(iter(get_signature(function).parameters))
+                dependencies = tuple(
+                    (name, param_type)
+                    for name, param_type in get_function_dependencies(function).items()
+                    if name != self_name
+                )
+            container = binder._container  # noqa: SLF001
+
             # Create a factory function that manually resolves dependencies
             def factory() -> Any:
-                # Get dependencies for the provider method
-                dependencies = get_function_dependencies(provider_method)
                 _logger.debug(
                     "Resolving %d dependencies for provider %s",
                     len(dependencies),
@@ -190,21 +241,17 @@ class ProviderModule(Module):
 
                 # Resolve dependencies from the container
                 resolved_args = {}
-                for param_name, param_type in dependencies.items():
+                for param_name, param_type in dependencies:
                     with suppress(Exception):
                         # First try to resolve by parameter name (string key)
-                        if binder._container.has(param_name):  # noqa: SLF001
-                            resolved_args[param_name] = binder._container.get(  # noqa: SLF001
-                                param_name
-                            )
+                        if container.has(param_name):
+                            resolved_args[param_name] = container.get(param_name)
                             _logger.debug(
                                 "Resolved dependency '%s' by name", param_name
                             )
                         else:
                             # Fall back to type-based resolution
-                            resolved_args[param_name] = binder._container.get(  # noqa: SLF001
-                                param_type
-                            )
+                            resolved_args[param_name] = container.get(param_type)
                             _logger.debug(
                                 "Resolved dependency '%s' by type: %s",
                                 param_name,
@@ -221,6 +268,7 @@ class ProviderModule(Module):
                 provider_method.__name__,
                 return_type,
             )
+            return return_type  # noqa: TRY300
 
         except Exception as e:
             msg = f"Failed to configure provider {provider_method.__name__}: {e}"
@@ -14,6 +14,7 @@ from .helpers import (
     format_type_name,
     get_class_constructor_dependencies,
     get_function_dependencies,
+    get_signature,
     is_injectable_class,
     is_injectable_function,
     safe_issubclass,
@@ -83,6 +84,7 @@ __all__ = [
     "format_type_name",
     "get_class_constructor_dependencies",
     "get_function_dependencies",
+    "get_signature",
     "get_type_name",
     "is_concrete_type",
     "is_generic_type",
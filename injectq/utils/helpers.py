@@ -1,7 +1,9 @@
 """Helper utilities for InjectQ dependency injection library."""
 
+import functools
 import inspect
 import threading
+import weakref
 from collections.abc import Callable
 from typing import Any, get_type_hints
 
@@ -9,17 +11,96 @@ from .exceptions import InjectionError
 from .types import normalize_type
 
 
+# Sentinel for cache misses
+_MISSING = object()
+
+# Per-callable caches. They are keyed weakly, so caching a factory closure
+# or a partial never keeps it (or the container it closes over) alive, and
+# bound methods are cached through their function, never their instance.
+_signatures: weakref.WeakKeyDictionary[Any, inspect.Signature] = (
+    weakref.WeakKeyDictionary()
+)
+_bound_signatures: weakref.WeakKeyDictionary[Any, inspect.Signature] = (
+    weakref.WeakKeyDictionary()
+)
+_dependencies: weakref.WeakKeyDictionary[Any, dict[str, type[Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+_bound_dependencies: weakref.WeakKeyDictionary[Any, dict[str, type[Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _weak_cached(
+    cache: weakref.WeakKeyDictionary,
+    key: Any,
+    compute: Callable[[Any], Any],
+) -> Any:
+    """Look ``key`` up in a weak-keyed cache, computing it on a miss.
+
+    Keys that cannot be weakly referenced or hashed are computed every time.
+    """
+    try:
+        value = cache.get(key, _MISSING)
+    except TypeError:
+        return compute(key)
+    if value is _MISSING:
+        value = cache[key] = compute(key)
+    return value
+
+
+def _drop_bound_parameter(sig: inspect.Signature) -> inspect.Signature:
+    """Turn a function's signature into that of a method bound from it."""
+    params = tuple(sig.parameters.values())
+    if params and params[0].kind in (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    ):
+        return sig.replace(parameters=params[1:])
+    return sig
+
+
+def _bound_signature(func: Callable[..., Any]) -> inspect.Signature:
+    return _drop_bound_parameter(_weak_cached(_signatures, func, inspect.signature))
+
+
+def get_signature(func: Callable[..., Any]) -> inspect.Signature:
+    """Get the signature of a callable, cached per callable.
+
+    Signatures are immutable, so repeated resolutions of the same constructor
+    or factory reuse the first lookup. The cache holds callables weakly, and
+    callables that cannot be weakly referenced are not cached.
+    """
+    if inspect.ismethod(func):
+        return _weak_cached(_bound_signatures, func.__func__, _bound_signature)
+    return _weak_cached(_signatures, func, inspect.signature)
+
+
 def get_function_dependencies(func: Callable[..., Any]) -> dict[str, type[Any]]:
     """Extract dependency types from function signature.
 
-    Type hints and Inject markers.
+    Type hints and Inject markers. The analysis is cached per callable in
+    the same weak-keyed way as signatures; each call returns its own copy.
     """
+    if inspect.ismethod(func):
+        dependencies = _weak_cached(
+            _bound_dependencies, func.__func__, _method_dependencies
+        )
+    else:
+        dependencies = _weak_cached(_dependencies, func, _function_dependencies)
+    return dict(dependencies)
+
+
+def _function_dependencies(func: Callable[..., Any]) -> dict[str, type[Any]]:
     try:
-        # Get type hints for the function
-        hints = get_type_hints(func)
+        # Get type hints for the function (a partial's come from the wrapped
+        # callable; its signature already drops the pre-bound arguments)
+        hints = get_type_hints(
+            func.func if isinstance(func, functools.partial) else func
+        )
 
         # Get function signature
-        sig = inspect.signature(func)
+        sig = get_signature(func)
 
         dependencies = {}
 
@@ -67,6 +148,18 @@ def get_function_dependencies(func: Callable[..., Any]) -> dict[str, type[Any]]:
         return dependencies
 
 
+def _method_dependencies(func: Callable[..., Any]) -> dict[str, type[Any]]:
+    """Dependencies of a method bound from ``func``, whatever its first name."""
+    dependencies = dict(_weak_cached(_dependencies, func, _function_dependencies))
+    params = tuple(get_signature(func).parameters.values())
+    if params and params[0].kind in (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    ):
+        dependencies.pop(params[0].name, None)
+    return dependencies
+
+
 def get_class_constructor_dependencies(cls: type[Any]) -> dict[str, type[Any]]:
     """Extract dependency types from class constructor type hints."""
     try:
@@ -82,7 +175,7 @@ def get_class_constructor_dependencies(cls: type[Any]) -> dict[str, type[Any]]:
 def is_injectable_function(func: Callable[..., Any]) -> bool:
     """Check if a function can be used for dependency injection."""
     try:
-        sig = inspect.signature(func)
+        sig = get_signature(func)
         # Function is injectable if it has parameters that can be analyzed
         # But skip functions with *args, **kwargs only
         params = [
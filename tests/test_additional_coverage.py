@@ -1,5 +1,7 @@
 """Additional tests to push coverage past 85%."""
 
+import asyncio
+
 import pytest
 
 from injectq import InjectQ
@@ -14,6 +16,7 @@ def test_service_binding_post_init() -> None:
     # Valid binding
     binding = ServiceBinding(service_type=str, implementation="test")
     assert binding.scope == "singleton"
+    assert not hasattr(binding, "__dict__")
 
     # Invalid binding with None implementation
     with pytest.raises(BindingError):
@@ -168,6 +171,42 @@ def test_registry_get_all_factories() -> None:
     assert int in factories
 
 
+def test_registry_views_shared_until_change() -> None:
+    """Test that binding/factory views are reused until the registry changes."""
+    registry = ServiceRegistry()
+    registry.bind(str, str)
+
+    bindings = registry.get_all_bindings()
+    assert registry.get_all_bindings() is bindings
+    with pytest.raises(TypeError):
+        bindings[int] = None  # type: ignore[index]
+
+    registry.bind_factory(int, lambda: 1)
+    assert registry.get_all_bindings() is not bindings
+    assert int in registry.get_all_factories()
+    assert int not in bindings
+
+
+def test_registry_keeps_one_entry_per_key() -> None:
+    """Test that a factory and a binding for one key replace each other."""
+    registry = ServiceRegistry()
+
+    registry.bind_instance("value", "bound", allow_concrete=False)
+    registry.bind_factory("value", lambda: "made")
+    assert registry.get_binding("value") is None
+    assert registry.get_factory("value") is not None
+    assert len(registry) == 1
+    assert registry.get_entry("value")[1] is registry.get_factory("value")
+    assert registry.get_entry("missing") is None
+    assert not registry.remove_binding("value")
+
+    registry.bind_instance("value", "bound", allow_concrete=False)
+    assert registry.get_factory("value") is None
+    assert registry.get_binding("value").implementation == "bound"
+    assert "value" in registry
+    assert repr(registry) == "ServiceRegistry(bindings=1, factories=0)"
+
+
 def test_registry_remove_factory() -> None:
     """Test removing factory."""
     registry = ServiceRegistry()
@@ -257,6 +296,36 @@ def test_singleton_scope_basic() -> None:
     assert value1 is value2
 
 
+def test_singleton_scope_caches_none() -> None:
+    """Test that a factory returning None is only called once."""
+    scope = SingletonScope()
+    calls = 0
+
+    def factory() -> None:
+        nonlocal calls
+        calls += 1
+
+    assert scope.get("nothing", factory) is None
+    assert scope.get("nothing", factory) is None
+    assert calls == 1
+
+
+def test_singleton_scope_builds_only_an_rlock(monkeypatch) -> None:
+    """Test that SingletonScope does not build a HybridLock it then discards."""
+    import threading
+
+    from injectq.core.thread_safety import HybridLock
+
+    def fail(self, *args, **kwargs) -> None:
+        msg = "HybridLock built for a singleton scope"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(HybridLock, "__init__", fail)
+
+    assert type(SingletonScope()._lock) is type(threading.RLock())
+    assert SingletonScope(thread_safe=False)._lock is None
+
+
 def test_singleton_scope_clear() -> None:
     """Test clearing singleton scope."""
     scope = SingletonScope()
@@ -315,6 +384,19 @@ def test_request_scope_basic() -> None:
     assert value1 == value2
 
 
+def test_request_scope_caches_none() -> None:
+    """Test request scope treats a cached None as a hit."""
+    scope = RequestScope()
+    calls = []
+
+    def factory() -> None:
+        calls.append(1)
+
+    assert scope.get("key", factory) is None
+    assert scope.get("key", factory) is None
+    assert len(calls) == 1
+
+
 def test_request_scope_clear() -> None:
     """Test request scope clear."""
     scope = RequestScope()
@@ -330,11 +412,151 @@ def test_request_scope_clear() -> None:
     assert True
 
 
+def test_request_scope_instances_are_per_thread() -> None:
+    """Test request scope keeps a separate instance per thread."""
+    import threading
+
+    scope = RequestScope()
+    main_value = scope.get("key", object)
+    other_values = []
+
+    def resolve() -> None:
+        other_values.append(scope.get("key", object))
+        other_values.append(scope.get("key", object))
+        scope.clear()
+
+    thread = threading.Thread(target=resolve)
+    thread.start()
+    thread.join()
+
+    assert other_values[0] is other_values[1]
+    assert other_values[0] is not main_value
+    # Clearing in the other thread leaves this thread's instance alone
+    assert scope.get("key", object) is main_value
+
+
+def test_resolve_scope_name() -> None:
+    """Test scope names resolve from enum members, strings and scopes."""
+    from injectq.core.async_scopes import create_enhanced_scope_manager
+    from injectq.core.scopes import ScopeManager
+    from injectq.utils.exceptions import ScopeError
+
+    for manager in (ScopeManager(), create_enhanced_scope_manager()):
+        assert manager.resolve_scope_name(ScopeType.SINGLETON) == "singleton"
+        assert manager.resolve_scope_name("request") == "request"
+        assert manager.resolve_scope_name("custom") == "custom"
+        assert manager.resolve_scope_name(RequestScope()) == "request"
+        with pytest.raises(ScopeError):
+            manager.resolve_scope_name(42)
+        with pytest.raises(ScopeError, match="Invalid scope type"):
+            manager.resolve_scope_name(["singleton"])
+
+
+def test_scope_context_tracks_stack_per_context() -> None:
+    """Test that nested scope contexts push and pop the scope stack."""
+    from injectq.core.scopes import ScopeManager
+
+    manager = ScopeManager()
+    with manager.scope_context("request"):
+        with manager.scope_context("action"):
+            assert manager._stack_var.get() == ("request", "action")
+        assert manager._stack_var.get() == ("request",)
+    assert manager._stack_var.get() == ()
+
+
+def test_transient_instances_skip_scope_lookup(monkeypatch) -> None:
+    """Test that transient lookups call the factory without a scope lookup."""
+    from injectq.core.scopes import ScopeManager
+
+    manager = ScopeManager()
+
+    def fail(self: ScopeManager, scope_name: str) -> None:
+        msg = "scope looked up"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(ScopeManager, "get_scope", fail)
+    first = manager.get_instance("key", object, "transient")
+    assert manager.get_instance("key", object, "transient") is not first
+
+    async def create() -> object:
+        return object()
+
+    async def resolve_async() -> tuple:
+        return (
+            await manager.aget_instance("key", create, "transient"),
+            await manager.aget_instance("key", object, "transient"),
+        )
+
+    first_async, second_async = asyncio.run(resolve_async())
+    assert type(first_async) is object
+    assert type(second_async) is object
+
+
+def test_replaced_transient_scope_is_used() -> None:
+    """Test that a custom scope registered as transient is not bypassed."""
+    from injectq.core.scopes import ScopeManager
+
+    class CachingScope(SingletonScope):
+        def __init__(self) -> None:
+            super().__init__()
+            self.name = "transient"
+
+    manager = ScopeManager()
+    manager.register_scope(CachingScope())
+    first = manager.get_instance("key", object, "transient")
+    assert manager.get_instance("key", object, "transient") is first
+
+
+def test_scope_managers_create_builtin_scopes_on_demand() -> None:
+    """Test that built-in scopes are only created when first used."""
+    from injectq.core.async_scopes import create_enhanced_scope_manager
+    from injectq.core.scopes import ScopeManager
+    from injectq.utils.exceptions import ScopeError
+
+    for manager in (ScopeManager(), create_enhanced_scope_manager()):
+        assert manager._scopes == {}
+        scope = manager.get_scope(ScopeType.SINGLETON)
+        assert isinstance(scope, SingletonScope)
+        assert manager.get_scope("singleton") is scope
+        assert list(manager._scopes) == ["singleton"]
+        with pytest.raises(ScopeError):
+            manager.get_scope("missing")
+
+
+def test_clear_all_scopes_tolerates_registration_during_clear() -> None:
+    """Test that a scope registered while clearing does not break iteration."""
+    from injectq.core.scopes import ScopeManager, ThreadLocalScope
+
+    manager = ScopeManager()
+    manager.get_scope("singleton")
+
+    class RegisteringScope(ThreadLocalScope):
+        def clear(self) -> None:
+            manager.register_scope(ThreadLocalScope("late"))
+
+    manager.register_scope(RegisteringScope("registering"))
+    manager.clear_all_scopes()
+
+    assert manager.get_scope("late").name == "late"
+
+
+def test_global_scope_manager_created_once() -> None:
+    """Test that the global scope manager is a lazily created singleton."""
+    from injectq.core.scopes import ScopeManager, get_scope_manager
+
+    manager = get_scope_manager()
+    assert isinstance(manager, ScopeManager)
+    assert get_scope_manager() is manager
+
+
 def test_scope_type_enum() -> None:
     """Test ScopeType enum."""
     assert ScopeType.SINGLETON.value == "singleton"
     assert ScopeType.TRANSIENT.value == "transient"
     assert ScopeType.REQUEST.value == "request"
+    # Members are the scope names themselves
+    assert ScopeType.ACTION == "action"
+    assert {"action": 1}[ScopeType.ACTION] == 1
 
 
 def test_resource_decorator_with_callable() -> None:
@@ -100,6 +100,10 @@ class TestComponentScope:
         scope = ComponentScope("test_component")
         assert scope.component_name == "test_component"
         assert scope.name == "component:test_component"
+        assert scope._lock is None
+
+        scope.name = "renamed"
+        assert scope.name == "renamed"
 
     def test_component_scope_get(self):
         """Test getting instances from component scope."""
@@ -116,13 +120,22 @@ class TestComponentScope:
         instance2 = scope.get("test_key", factory)
         assert instance2 is instance1
 
+    def test_component_scope_caches_none(self):
+        """Test a factory returning None is only called once."""
+        scope = ComponentScope("test")
+        factory = Mock(return_value=None)
+
+        assert scope.get("test_key", factory) is None
+        assert scope.get("test_key", factory) is None
+        factory.assert_called_once()
+
     def test_component_scope_clear(self):
         """Test clearing component scope."""
         scope = ComponentScope("test")
 
         # Mock instance with stop/destroy methods
         mock_instance = Mock()
-        scope._instances["test"] = mock_instance
+        scope.get("test", lambda: mock_instance)
 
         scope.clear()
 
@@ -164,6 +177,17 @@ class TestComponent:
         component.destroy()
         assert component.state == ComponentState.DESTROYED
 
+    def test_component_scope_created_on_demand(self):
+        """Test a component's scope is only built when first accessed."""
+        component = MessageComponent()
+        component.configure()
+        component.start()
+        component.stop()
+        component.destroy()
+        assert component._scope is None
+
+        assert MessageComponent().scope.name == "component:message"
+
     def test_component_dependency_resolution(self):
         """Test component dependency resolution."""
         component = StorageComponent()
@@ -241,12 +265,65 @@ class TestComponentRegistry:
         )
 
         assert binding.component_type == StorageComponent
+        assert binding.name == "my_storage"
         assert binding.configuration["db_url"] == "sqlite:///:memory:"
         assert "test" in binding.tags
         assert "persistence" in binding.tags  # From component class
         assert binding.priority == 5
         assert binding.auto_start is False
 
+    def test_binding_interface_inferred_once_per_class(self, monkeypatch):
+        """Test re-registering a class reuses the inferred interface."""
+        import injectq.components as components
+
+        first = self.registry.register(MessageComponent)
+
+        def fail(obj):
+            msg = "type hints evaluated again"
+            raise AssertionError(msg)
+
+        monkeypatch.setattr(components, "get_type_hints", fail)
+
+        self.registry.clear()
+        second = self.registry.register(MessageComponent)
+        assert second.interface is first.interface
+
+    def test_interface_cache_does_not_keep_classes_alive(self):
+        """Test that a component class defined at runtime can be collected."""
+        import gc
+        import weakref
+
+        class TemporaryComponent(MessageComponent):
+            name = "temporary"
+
+        self.registry.register(TemporaryComponent)
+        self.registry.clear()
+
+        ref = weakref.ref(TemporaryComponent)
+        del TemporaryComponent
+        gc.collect()
+
+        assert ref() is None
+
+    def test_register_freezes_component_metadata(self):
+        """Test binding metadata is immutable and class tags are not shared."""
+        binding = self.registry.register(StorageComponent, tags={"test"})
+
+        assert binding.provided_interfaces == frozenset({IStorageService})
+        assert binding.dependencies == frozenset({IMessageService})
+        assert binding.tags == frozenset({"persistence", "critical", "test"})
+        assert binding.provided_interface_names == ("IStorageService",)
+        assert binding.dependency_names == ("IMessageService",)
+        assert not hasattr(binding, "__dict__")
+        assert StorageComponent.tags == {"persistence", "critical"}
+
+    def test_register_accepts_any_iterable_of_tags(self):
+        """Test that extra tags may be passed as a list."""
+        binding = self.registry.register(StorageComponent, tags=["test", "extra"])
+
+        assert binding.tags == frozenset({"persistence", "critical", "test", "extra"})
+        assert self.registry.get_bindings_by_tag("extra") == [binding]
+
     def test_get_bindings_by_tag(self):
         """Test getting bindings by tag."""
         self.registry.register(MessageComponent)
@@ -265,6 +342,50 @@ class TestComponentRegistry:
         assert len(message_bindings) == 1
         assert message_bindings[0].component_type == MessageComponent
 
+    def test_binding_indexes_follow_reregistration(self):
+        """Test tag and interface lookups drop a replaced binding."""
+        self.registry.register(StorageComponent, tags={"old"})
+        binding = self.registry.register(StorageComponent, tags={"new"})
+
+        assert self.registry.get_bindings_by_tag("old") == []
+        assert self.registry.get_bindings_by_tag("new") == [binding]
+        assert self.registry.get_bindings_by_interface(IStorageService) == [binding]
+
+        self.registry.clear()
+        assert self.registry.get_bindings_by_interface(IStorageService) == []
+
+    def test_interface_provider_follows_reregistration(self):
+        """Test a re-registered name stops providing interfaces it dropped."""
+
+        class DbComponent(Component):
+            name = "db"
+            provides = [IStorageService]
+
+        class PlainDbComponent(Component):
+            name = "db"
+
+        class OtherStorageComponent(Component):
+            name = "other"
+            provides = [IStorageService]
+
+        class AuditComponent(Component):
+            name = "audit"
+            requires = [IStorageService]
+
+        self.registry.register(DbComponent)
+        self.registry.register(OtherStorageComponent)
+        self.registry.register(AuditComponent, priority=10)
+        self.registry.register(PlainDbComponent)
+
+        order = self.registry.get_startup_order()
+        assert order.index("other") < order.index("audit")
+
+        container = ComponentContainer()
+        container.component_registry = self.registry
+        dependencies: set[str] = set()
+        container._add_dependencies("audit", dependencies)
+        assert dependencies == {"other"}
+
     def test_startup_order(self):
         """Test component startup order calculation."""
         self.registry.register(MessageComponent)
@@ -277,6 +398,41 @@ class TestComponentRegistry:
         storage_idx = order.index("storage")
         assert message_idx < storage_idx
 
+    def test_startup_order_respects_priority_and_dependencies(self):
+        """Test independent components start by priority, after their providers."""
+
+        class AuditComponent(Component):
+            name = "audit"
+            requires = [IStorageService]
+
+        class MetricsComponent(Component):
+            name = "metrics"
+
+        self.registry.register(AuditComponent, priority=10)
+        self.registry.register(StorageComponent, priority=1)
+        self.registry.register(MetricsComponent, priority=5)
+        self.registry.register(MessageComponent)
+
+        order = self.registry.get_startup_order()
+
+        assert order == ["metrics", "message", "storage", "audit"]
+
+    def test_startup_order_cached_until_registration_changes(self):
+        """Test the startup order is reused and recomputed after register/clear."""
+        self.registry.register(StorageComponent)
+
+        first = self.registry.get_startup_order()
+        first.append("mutated")
+        assert self.registry.get_startup_order() == ["storage"]
+
+        self.registry.register(MessageComponent)
+        assert self.registry.get_startup_order() == ["message", "storage"]
+        assert self.registry.get_shutdown_order() == ["storage", "message"]
+
+        self.registry.clear()
+        assert self.registry.get_startup_order() == []
+        assert self.registry.get_shutdown_order() == []
+
     def test_circular_dependency_detection(self):
         """Test circular dependency detection."""
 
@@ -370,15 +526,44 @@ class TestComponentContainer:
         # Start only message component
         self.container.start_components(["message"])
 
+        message_comp = self.container.get_component("message")
+
+        assert message_comp is not None
+        assert message_comp.state == ComponentState.STARTED
+        # Components outside the requested set are not instantiated
+        assert self.container.get_component("storage") is None
+        assert self.container.list_components()["storage"] == (
+            ComponentState.INITIALIZED
+        )
+
+    def test_start_specific_components_starts_dependencies(self):
+        """Test starting a component also starts the components it requires."""
+        self.container.register_component(MessageComponent)
+        self.container.register_component(StorageComponent)
+
+        self.container.start_components(["storage"])
+
         message_comp = self.container.get_component("message")
         storage_comp = self.container.get_component("storage")
 
         assert message_comp is not None
         assert storage_comp is not None
         assert message_comp.state == ComponentState.STARTED
-        assert (
-            storage_comp.state == ComponentState.CONFIGURED
-        )  # Configured but not started
+        assert storage_comp.state == ComponentState.STARTED
+
+    def test_add_dependencies_handles_deep_chains(self):
+        """Test transitive dependency collection does not recurse per edge."""
+        depth = 5000
+        registry = self.container.component_registry
+        for i in range(depth):
+            registry._dependency_graph[f"c{i}"] = (f"I{i + 1}",)
+            registry._interface_providers[f"I{i + 1}"] = f"c{i + 1}"
+
+        collected = {"c0"}
+        self.container._add_dependencies("c0", collected)
+
+        assert len(collected) == depth + 1
+        assert f"c{depth}" in collected
 
     def test_stop_components(self):
         """Test stopping components."""
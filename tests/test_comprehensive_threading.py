@@ -1167,6 +1167,8 @@ async def test_async_cascading_dependencies():
         service = container.get(Level3Service)
         results.append(
             {
+                # Keep the service alive so its id is not reused
+                "service": service,
                 "level3_id": id(service),
                 "level2_id": id(service.level2),
                 "level1_id": id(service.level2.level1),
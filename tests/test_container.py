@@ -1,5 +1,7 @@
 """Test basic functionality of InjectQ container."""
 
+import subprocess
+import sys
 
 import pytest
 
@@ -190,6 +192,48 @@ def test_factory_binding():
     assert db.connection_string == "factory://connection"
 
 
+def test_string_keys_are_interned():
+    """Test that string keys are stored interned and resolve from any copy."""
+    container = InjectQ()
+
+    key = "".join(["db_", "host"])  # built at runtime, so not interned
+    container.bind_instance(key, "localhost")
+    container.bind_factory("".join(["db_", "port"]), lambda: 5432)
+
+    stored = next(k for k in container._registry._entries if k == "db_host")
+    assert stored is sys.intern("db_host")
+    assert container.get("db_host") == "localhost"
+    assert container.get("db_port") == 5432
+
+
+def test_scope_names_are_interned():
+    """Test that bindings store interned scope names."""
+    container = InjectQ()
+
+    class Service:
+        pass
+
+    container.bind(Service, Service, scope="".join(["trans", "ient"]))
+
+    binding = container._registry.get_binding(Service)
+    assert binding.scope is sys.intern("transient")
+
+
+def test_rebinding_instance_returns_new_value():
+    """Test that re-binding an instance is visible after an earlier get."""
+    container = InjectQ()
+
+    container.bind(str, "first")
+    container.bind_instance("name", "first")
+    assert container.get(str) == "first"
+    assert container.get("name") == "first"
+
+    container.bind(str, "second")
+    container.bind_instance("name", "second")
+    assert container.get(str) == "second"
+    assert container.get("name") == "second"
+
+
 def test_dependency_not_found():
     """Test error when dependency not found."""
     container = InjectQ()
@@ -252,6 +296,53 @@ def test_container_override():
     assert container.get(str) == "original"
 
 
+def test_override_rebuilds_dependents_and_restores_singletons():
+    """Test override rebuilds dependent singletons, then restores the old ones."""
+    container = InjectQ()
+    container.bind_instance(str, "postgresql://real/db")
+    container.bind(Database, Database)
+    real = container.get(Database)
+
+    with container.override(str, "sqlite://test.db"):
+        overridden = container.get(Database)
+        assert overridden.connection_string == "sqlite://test.db"
+
+    assert container.get(Database) is real
+
+
+def test_override_rebuilds_singletons_if_bindings_changed():
+    """Test parked singletons are dropped if bindings change during override."""
+    container = InjectQ()
+    container.bind_instance(str, "postgresql://real/db")
+    container.bind(Database, Database)
+    real = container.get(Database)
+
+    with container.override(str, "sqlite://test.db"):
+        container.bind_instance("unrelated", 1)
+
+    assert container.get(Database) is not real
+
+
+def test_container_objects_have_no_instance_dict():
+    """Test that containers, proxies and built-in scopes use slots."""
+    import weakref
+
+    from injectq.core.container import ModuleBinder
+    from injectq.core.scopes import ScopeManager
+
+    container = InjectQ()
+    for obj in (
+        container,
+        container.factories,
+        ModuleBinder(container),
+        container._scope_manager.get_scope("singleton"),
+        ScopeManager(),
+    ):
+        assert not hasattr(obj, "__dict__"), type(obj)
+
+    assert weakref.ref(container)() is container
+
+
 def test_container_validation():
     """Test container validation."""
     container = InjectQ()
@@ -271,5 +362,108 @@ def test_container_validation():
         container.validate()
 
 
+def test_batch_bind_applies_bindings_on_exit():
+    """Test batch_bind stages bindings and applies them together."""
+    container = InjectQ()
+    db = Database("batched")
+
+    version = container._bindings_version
+
+    with container.batch_bind() as bindings:
+        bindings["name"] = "agent"
+        bindings[Database] = db
+        bindings["other"] = Database
+        assert not container.has("name")
+
+    # The whole batch invalidates the memoized singletons once
+    assert container._bindings_version == version + 1
+    assert container.get("name") == "agent"
+    assert isinstance(container.get("other"), Database)
+    assert container.get(Database) is db
+
+
+def test_batch_bind_discards_bindings_on_error():
+    """Test batch_bind binds nothing when the block raises."""
+    container = InjectQ()
+
+    with pytest.raises(RuntimeError):
+        with container.batch_bind() as bindings:
+            bindings["name"] = "agent"
+            raise RuntimeError
+
+    assert not container.has("name")
+
+
+def test_singleton_lookups_memoized_until_bindings_change(monkeypatch):
+    """Test repeated get() of a singleton skips the resolver until rebinding."""
+    container = InjectQ()
+    container.bind_instance(str, "postgresql://memo/db")
+    container.bind(Database, Database)
+
+    first = container.get(Database)
+
+    def fail(service_type):
+        msg = "resolver called for a memoized singleton"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(container, "_resolve", fail)
+    assert container.get(Database) is first
+    assert container[Database] is first
+
+    monkeypatch.undo()
+    container.bind_instance(str, "postgresql://rebound/db")
+    container.clear_scope("singleton")
+    assert container.get(Database).connection_string == "postgresql://rebound/db"
+
+
+def test_transient_and_factory_lookups_not_memoized():
+    """Test only singleton bindings are memoized by get()."""
+    container = InjectQ()
+    container.bind_instance(str, "postgresql://memo/db")
+    container.bind(Database, Database, scope="transient")
+    container.bind_factory("token", lambda: object())
+
+    assert container.get(Database) is not container.get(Database)
+    assert container.get("token") is not container.get("token")
+
+
+def test_optional_subpackages_are_imported_lazily():
+    """Test that importing injectq defers components/diagnostics/testing."""
+    code = (
+        "import sys, injectq\n"
+        "lazy = ('injectq.components', 'injectq.diagnostics', 'injectq.testing')\n"
+        "assert not any(name in sys.modules for name in lazy)\n"
+        "assert injectq.ComponentRegistry.__module__ == 'injectq.components'\n"
+        "assert injectq.testing.__name__ == 'injectq.testing'\n"
+        "assert injectq.components.__name__ == 'injectq.components'\n"
+        "assert injectq.diagnostics.__name__ == 'injectq.diagnostics'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_discarded_container_is_not_kept_alive_by_caches():
+    """Test that caching factory plans does not pin the container."""
+    import gc
+    import weakref
+
+    class Greeter:
+        def __init__(self, container: InjectQ) -> None:
+            self.container = container
+
+        def greet(self, name: str) -> str:
+            return f"hello {name}"
+
+    container = InjectQ()
+    container.bind_factory("greeting", Greeter(container).greet)
+    assert container.invoke("greeting", name="x") == "hello x"
+    assert container.call_factory("greeting", "y") == "hello y"
+
+    ref = weakref.ref(container)
+    del container
+    gc.collect()
+
+    assert ref() is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
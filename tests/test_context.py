@@ -57,6 +57,21 @@ def test_container_context_nested() -> None:
     assert ContainerContext.get_current() is None
 
 
+def test_container_context_not_shared_with_other_threads() -> None:
+    """Test that a container set in one thread is invisible to others."""
+    import threading
+
+    seen = []
+    with ContainerContext.use(InjectQ()):
+        thread = threading.Thread(
+            target=lambda: seen.append(ContainerContext.get_current())
+        )
+        thread.start()
+        thread.join()
+
+    assert seen == [None]
+
+
 def test_container_context_multiple_calls() -> None:
     """Test setting container multiple times."""
     container1 = InjectQ()
@@ -96,6 +111,19 @@ def test_container_context_clear() -> None:
     assert ContainerContext.get_current() is None
 
 
+def test_get_instance_prefers_context_over_default() -> None:
+    """Test get_instance returns the active context, else the default."""
+    ContainerContext.clear_current()
+    default = InjectQ.get_instance()
+    assert InjectQ.get_instance() is default
+
+    container = InjectQ()
+    with ContainerContext.use(container):
+        assert InjectQ.get_instance() is container
+
+    assert InjectQ.get_instance() is default
+
+
 def test_container_context_use_async() -> None:
     """Test ContainerContext.use_async as async context manager."""
 
@@ -152,5 +180,22 @@ def test_container_context_use_async_with_exception() -> None:
     asyncio.run(async_test())
 
 
+def test_container_context_exited_in_another_context() -> None:
+    """Test that leaving use() from a different context restores the old value."""
+    import contextvars
+
+    outer = InjectQ()
+    ContainerContext.set_current(outer)
+    manager = ContainerContext.use(InjectQ())
+    manager.__enter__()
+
+    def exit_elsewhere() -> InjectQ | None:
+        manager.__exit__(None, None, None)
+        return ContainerContext.get_current()
+
+    assert contextvars.copy_context().run(exit_elsewhere) is outer
+    ContainerContext.clear_current()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -198,6 +198,24 @@ class TestInvokeMethod:
         with pytest.raises(DependencyNotFoundError):
             container.invoke("service", invalid_arg="test")
 
+    def test_invoke_repeated_calls_pick_up_new_bindings(self):
+        """Test the cached invoke plan still resolves against current bindings."""
+        container = InjectQ()
+        container.bind(Database, Database)
+
+        def create_service(db: Database, user_id: str) -> dict:
+            return {"db": db, "user_id": user_id}
+
+        container.bind_factory("service", create_service)
+
+        first = container.invoke("service", user_id="a")
+        container.bind_instance("user_id", "from-container")
+        second = container.invoke("service")
+
+        assert first["user_id"] == "a"
+        assert second["user_id"] == "from-container"
+        assert isinstance(second["db"], Database)
+
 
 # =============================================================================
 # Test async factory methods
@@ -1,10 +1,11 @@
 """Test inject decorator functionality."""
 
 import asyncio
+import inspect
 
 import pytest
 
-from injectq import InjectQ, inject
+from injectq import Inject, InjectQ, inject
 from injectq.utils import InjectionError
 
 
@@ -234,5 +235,132 @@ def test_inject_no_type_hints():
     assert result == 3
 
 
+def test_inject_does_not_inspect_signature_per_call(monkeypatch):
+    """Test that the signature is computed at decoration time only."""
+    container = InjectQ()
+    container.bind_instance(MockService, MockService("cached"))
+
+    @inject(container=container)
+    def function_with_dependency(service: MockService) -> str:
+        return service.get_value()
+
+    def fail(*args, **kwargs):
+        msg = "inspect.signature called at call time"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(inspect, "signature", fail)
+
+    assert function_with_dependency() == "cached"
+    assert function_with_dependency() == "cached"
+
+
+def test_inject_marker_default_resolves_marker_key():
+    """Test that an Inject[...] default resolves its own key, not the hint."""
+    container = InjectQ()
+    container.bind_instance("greeting", "hello")
+
+    @inject(container=container)
+    def greet(message: str = Inject["greeting"]) -> str:  # type: ignore[assignment]
+        return message
+
+    assert greet() == "hello"
+    assert greet("hi") == "hi"
+
+
+def test_injection_plan_built_at_decoration():
+    """Test that each injectable parameter's handling is decided up front."""
+    from injectq.decorators.inject import _build_injection_plan
+    from injectq.utils import get_function_dependencies
+
+    def handler(
+        service: MockService,
+        timeout: int = 5,
+        message: str = Inject["greeting"],  # type: ignore[assignment]
+    ) -> None:
+        pass
+
+    plan = _build_injection_plan(
+        inspect.signature(handler), get_function_dependencies(handler)
+    )
+
+    assert plan == (
+        ("service", MockService, False, False, 0, False),
+        ("timeout", int, False, True, 1, True),
+        ("message", "greeting", True, True, 2, True),
+    )
+
+
+def test_inject_keeps_unbound_defaults_without_resolving(monkeypatch):
+    """Test that defaulted parameters nothing can provide skip container.get."""
+    container = InjectQ()
+
+    @inject(container=container)
+    def handler(timeout: int = 5, name: str = Inject["missing"]) -> int:  # type: ignore[assignment]
+        return timeout
+
+    def fail(self, service_type):
+        msg = f"unexpected lookup of {service_type}"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(InjectQ, "get", fail)
+    assert handler() == 5
+
+
+def test_inject_marker_has_no_instance_dict():
+    """Test that Inject markers store their state in slots."""
+    assert Inject.__dictoffset__ == 0
+    marker = Inject[MockService]
+    assert object.__getattribute__(marker, "service_type") is MockService
+
+
+def test_inject_skips_parameters_passed_by_caller():
+    """Test that positional, keyword and positional-only arguments all count."""
+    container = InjectQ()
+    container.bind_instance(MockService, MockService("injected"))
+    supplied = MockService("supplied")
+
+    @inject(container=container)
+    def by_keyword(*, service: MockService) -> str:
+        return service.value
+
+    @inject(container=container)
+    def positional_only(service: MockService, /, suffix: str = "") -> str:
+        return service.value + suffix
+
+    @inject(container=container)
+    def with_varargs(label: str, *rest: int, service: MockService) -> tuple:
+        return label, rest, service.value
+
+    assert by_keyword() == "injected"
+    assert by_keyword(service=supplied) == "supplied"
+    assert positional_only() == "injected"
+    assert positional_only(supplied, "!") == "supplied!"
+    assert with_varargs("x", 1, 2) == ("x", (1, 2), "injected")
+
+
+def test_inject_reports_bad_calls_before_resolving(monkeypatch):
+    """Test that arguments that cannot bind fail before any injection."""
+    container = InjectQ()
+
+    @inject(container=container)
+    def handler(label: str, service: MockService) -> str:
+        return label
+
+    def fail(self, service_type):
+        msg = f"unexpected lookup of {service_type}"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(InjectQ, "get", fail)
+
+    with pytest.raises(InjectionError, match="Injection failed for handler: .*"):
+        handler("x", unknown=1)  # type: ignore[call-arg]
+    with pytest.raises(InjectionError, match="unexpected keyword argument 'unknown'"):
+        handler("x", unknown=1)  # type: ignore[call-arg]
+    with pytest.raises(InjectionError, match="too many positional arguments"):
+        handler("x", MockService("a"), "extra")  # type: ignore[call-arg]
+    with pytest.raises(InjectionError, match="multiple values for argument 'label'"):
+        handler("x", label="y")  # type: ignore[call-arg]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
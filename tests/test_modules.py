@@ -106,6 +106,113 @@ def test_provider_module():
     assert pool1 == pool2
 
 
+def test_provider_module_collects_providers_per_class():
+    """Test that @provider methods are discovered at class creation."""
+
+    class BaseModule(ProviderModule):
+        @provider
+        def provide_url(self) -> str:
+            return "postgresql://inherited/db"
+
+    class DatabaseModule(BaseModule):
+        @provider
+        def provide_database(self, url: str) -> MockDatabase:
+            return MockDatabase(url)
+
+        def helper(self) -> None:
+            pass
+
+    assert DatabaseModule._provider_names == ("provide_database", "provide_url")
+
+    container = InjectQ([DatabaseModule()])
+    assert container.get(str) == "postgresql://inherited/db"
+
+
+def test_provider_decorator_returns_function_unchanged():
+    """Test that @provider marks the function in place."""
+
+    def provide_value() -> str:
+        return "value"
+
+    assert provider(provide_value) is provide_value
+    assert provide_value._is_provider is True
+
+
+def test_provider_dependencies_analyzed_at_install(monkeypatch):
+    """Test that provider dependencies are not re-analyzed per resolution."""
+    from injectq.modules import base
+
+    class DatabaseProviders(ProviderModule):
+        @provider
+        def provide_database(self, url: str) -> MockDatabase:
+            return MockDatabase(url)
+
+    container = InjectQ()
+    container.bind_instance(str, "postgresql://install/db")
+    container.install_module(DatabaseProviders())
+
+    def fail(func):
+        msg = "dependencies analyzed at resolution time"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(base, "get_function_dependencies", fail)
+
+    assert container.get(MockDatabase).url == "postgresql://install/db"
+    assert container.get(MockDatabase).url == "postgresql://install/db"
+
+
+def test_discarded_provider_module_is_not_kept_alive():
+    """Test that installing a provider module does not pin it or its container."""
+    import gc
+    import weakref
+
+    class DatabaseProviders(ProviderModule):
+        @provider
+        def provide_database(self, url: str) -> MockDatabase:
+            return MockDatabase(url)
+
+    module = DatabaseProviders()
+    container = InjectQ([module])
+    container.bind_instance(str, "postgresql://gc/db")
+    assert container.get(MockDatabase).url == "postgresql://gc/db"
+
+    refs = [weakref.ref(module), weakref.ref(container)]
+    del module, container
+    gc.collect()
+
+    assert all(ref() is None for ref in refs)
+
+
+def test_provider_return_types_cached_per_class(monkeypatch):
+    """Test that provider return types are resolved once per module class."""
+    from injectq.modules import base
+
+    class ValueProviders(ProviderModule):
+        @provider
+        def provide_timeout(self) -> int:
+            return 30
+
+        @provider
+        def provide_url(self) -> str:
+            return "postgresql://cached/db"
+
+    assert ValueProviders._provider_return_types is None
+
+    InjectQ().install_module(ValueProviders())
+    assert ValueProviders._provider_return_types == (int, str)
+
+    def fail(func):
+        msg = "return types resolved again"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(base, "get_type_hints", fail)
+
+    container = InjectQ()
+    container.install_module(ValueProviders())
+    assert container.get(int) == 30
+    assert container.get(str) == "postgresql://cached/db"
+
+
 def test_module_composition():
     """Test composing multiple modules."""
 
@@ -132,6 +239,28 @@ def test_module_composition():
     assert user["timeout"] == 45
 
 
+def test_constructor_modules_share_one_binder():
+    """Test that modules given to InjectQ() are configured with one binder."""
+    binders = []
+
+    class RecordingModule(Module):
+        def configure(self, binder):
+            binders.append(binder)
+
+    InjectQ([RecordingModule(), RecordingModule(), RecordingModule()])
+
+    assert len(binders) == 3
+    assert binders[0] is binders[1] is binders[2]
+
+
+def test_constructor_rejects_module_without_configure():
+    """Test that a module without configure() is rejected."""
+    from injectq.utils import BindingError
+
+    with pytest.raises(BindingError):
+        InjectQ([object()])
+
+
 def test_module_with_injection():
     """Test modules with @inject decorated methods."""
 
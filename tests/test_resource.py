@@ -192,5 +192,26 @@ async def test_shutdown_all_resources():
     assert async_cleanup_called
 
 
+def test_shutdown_all_tolerates_registration_during_cleanup():
+    """Test that cleanup code registering a resource does not break shutdown."""
+    from injectq.decorators.resource import ResourceManager, SyncResourceLifecycle
+
+    manager = ResourceManager()
+
+    def registering_resource():
+        try:
+            yield "value"
+        finally:
+            manager.register_resource("late", SyncResourceLifecycle(lambda: "late"))
+
+    manager.register_resource("first", SyncResourceLifecycle(registering_resource))
+    manager.initialize_resource("first")
+
+    manager.shutdown_all()
+
+    assert not manager.get_resource("first").initialized
+    assert manager.get_resource("late") is not None
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
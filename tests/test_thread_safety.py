@@ -287,6 +287,44 @@ def test_scope_thread_safety():
     assert all(isinstance(result, TestService) for result in results)
 
 
+def test_singleton_scope_factory_runs_once_under_contention():
+    """Test that racing threads share one singleton and one factory call."""
+    from injectq.core.scopes import SingletonScope
+
+    scope = SingletonScope()
+    calls = []
+    barrier = threading.Barrier(8)
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.01)
+        return object()
+
+    def resolve(results: list, index: int):
+        barrier.wait()
+        results[index] = scope.get("key", factory)
+
+    results = [None] * 8
+    threads = [threading.Thread(target=resolve, args=(results, i)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_singleton_scope_factory_can_resolve_nested_singletons():
+    """Test that a singleton factory may create other singletons in its scope."""
+    from injectq.core.scopes import SingletonScope
+
+    scope = SingletonScope()
+    inner = scope.get("outer", lambda: scope.get("inner", object))
+
+    assert scope.get("inner", object) is inner
+
+
 def test_performance_impact():
     """Test that thread safety doesn't significantly impact performance."""
     import time
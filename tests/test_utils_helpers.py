@@ -1,5 +1,6 @@
 """Comprehensive tests for utils/helpers.py."""
 
+import functools
 import threading
 
 import pytest
@@ -10,6 +11,7 @@ from injectq.utils.helpers import (
     format_type_name,
     get_class_constructor_dependencies,
     get_function_dependencies,
+    get_signature,
     is_injectable_class,
     is_injectable_function,
     safe_issubclass,
@@ -89,6 +91,16 @@ def test_get_function_dependencies_with_union() -> None:
     assert deps["value"] == str
 
 
+def test_get_function_dependencies_with_partial() -> None:
+    """Test a partial reports only the parameters it leaves open."""
+
+    def example_func(name: str, value: int) -> None:
+        pass
+
+    deps = get_function_dependencies(functools.partial(example_func, "bound"))
+    assert deps == {"value": int}
+
+
 def test_get_class_constructor_dependencies() -> None:
     """Test extracting dependencies from class constructor."""
 
@@ -316,5 +328,107 @@ def test_format_type_name_with_builtin() -> None:
     assert format_type_name(int) == "int"
 
 
+def test_get_signature_is_cached() -> None:
+    """Test that signatures are computed once per callable."""
+
+    def example_func(service: str, value: int = 1) -> None:
+        pass
+
+    sig = get_signature(example_func)
+    assert list(sig.parameters) == ["service", "value"]
+    assert get_signature(example_func) is sig
+
+
+def test_get_signature_unhashable_callable() -> None:
+    """Test that unhashable callables still get a signature."""
+
+    class UnhashableCallable:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self, service: str) -> None:
+            pass
+
+    sig = get_signature(UnhashableCallable())
+    assert list(sig.parameters) == ["service"]
+
+
+def test_get_signature_cache_does_not_keep_callables_alive() -> None:
+    """Test that cached signatures never pin bound instances or partials."""
+    import gc
+    import weakref
+
+    class Owner:
+        def method(self, service: str) -> None:
+            pass
+
+    owner = Owner()
+    assert list(get_signature(owner.method).parameters) == ["service"]
+    assert list(get_signature(functools.partial(owner.method)).parameters) == [
+        "service"
+    ]
+
+    def make_closure(target: Owner) -> object:
+        def factory(service: str) -> Owner:
+            return target
+
+        return factory
+
+    captured = Owner()
+    closure = make_closure(captured)
+    get_signature(closure)
+
+    refs = [weakref.ref(owner), weakref.ref(captured), weakref.ref(closure)]
+    del owner, captured, closure
+    gc.collect()
+
+    assert all(ref() is None for ref in refs)
+
+
+def test_get_function_dependencies_is_cached() -> None:
+    """Test that dependencies are analyzed once per callable."""
+
+    def example_func(service: str, value: int = 1) -> None:
+        pass
+
+    deps = get_function_dependencies(example_func)
+    assert deps == {"service": str, "value": int}
+
+    # Callers get their own copy, so changing it cannot corrupt the cache
+    deps["service"] = int
+    assert get_function_dependencies(example_func) == {"service": str, "value": int}
+
+
+def test_get_function_dependencies_cache_does_not_keep_methods_alive() -> None:
+    """Test that analyzing a bound method does not pin its instance."""
+    import gc
+    import weakref
+
+    class Owner:
+        def method(this, service: str) -> None:  # noqa: N805
+            pass
+
+    owner = Owner()
+    assert get_function_dependencies(owner.method) == {"service": str}
+
+    ref = weakref.ref(owner)
+    del owner
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_get_function_dependencies_unhashable_callable() -> None:
+    """Test that unhashable callables are still analyzed."""
+
+    class Unhashable:
+        __hash__ = None  # type: ignore[assignment]
+
+        def method(self, service: str) -> None:
+            pass
+
+    # A bound method hashes its instance, so it cannot be cached
+    assert get_function_dependencies(Unhashable().method) == {"service": str}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])